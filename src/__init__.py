@@ -6,16 +6,38 @@ through a command-line interface.
 """
 
 import logging
-import logging.handlers
 import os
 import sys
-from dotenv import load_dotenv
+from typing import Optional
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Paths of .env files that have already been loaded into os.environ
+_loaded_env_paths = set()
+
+
+def ensure_env(dotenv_path: Optional[str] = None) -> None:
+    """
+    Load environment variables from a .env file, at most once per path.
+
+    Args:
+        dotenv_path: Path to the .env file. Defaults to the closest .env file
+            found by walking up from this package's directory.
+    """
+    if dotenv_path in _loaded_env_paths:
+        return
+    _loaded_env_paths.add(dotenv_path)
+
+    from src.utils.env import find_env_file, load_env
+
+    if dotenv_path is None:
+        dotenv_path = find_env_file(os.path.dirname(os.path.abspath(__file__)))
+    load_env(dotenv_path)
+
+
 # Load environment variables from .env file if present
-load_dotenv()
+ensure_env()
 
 # Check if IS_TESTING environment variable is already set
 if os.environ.get("IS_TESTING") == "1":
@@ -30,16 +52,33 @@ else:
         NEO_HOME = "/tmp/.neo"
         IS_TESTING = True
 
+# Background listener that writes queued log records to the log files
+_log_listener = None
+# Handler on the root logger that feeds _log_listener
+_log_queue_handler = None
+
+
 def setup_logging() -> None:
     """
     Configure centralized logging for the entire application.
     
     This function sets up:
-    - File logging for all messages in {NEO_HOME}/logs/stdout.log
+    - Buffered file logging for all messages in {NEO_HOME}/logs/stdout.log,
+      flushed on warnings and above, periodically, and at exit
     - File logging for warnings and above in {NEO_HOME}/logs/stderr.log
+    - File handlers run on a background QueueListener thread, so logging
+      calls only enqueue records
     - Console logging only if LOG_TO_CONSOLE=1 is set (disabled by default)
     - Conservative logging levels for noisy third-party libraries
     """
+    import atexit
+    import logging.handlers
+    import queue
+
+    from src.utils.log_handlers import BufferedRotatingFileHandler, CachedTimeFormatter
+
+    global _log_listener, _log_queue_handler
+
     # Get log level from environment or use INFO as default
     log_level_name = os.environ.get("LOG_LEVEL", "INFO")
     log_level = getattr(logging, log_level_name)
@@ -53,7 +92,7 @@ def setup_logging() -> None:
     stderr_log_file = os.path.join(log_dir, "stderr.log")
     
     # Create a formatter for all handlers
-    formatter = logging.Formatter(
+    formatter = CachedTimeFormatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
@@ -63,11 +102,12 @@ def setup_logging() -> None:
     # Remove all existing handlers to prevent duplication
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
-    
+    _stop_log_listener()
+
     root_logger.setLevel(log_level)
     
     # Create stdout log file handler
-    stdout_handler = logging.handlers.RotatingFileHandler(
+    stdout_handler = BufferedRotatingFileHandler(
         stdout_log_file,
         maxBytes=10485760,  # 10MB
         backupCount=3,  # Keep 3 backup files
@@ -76,7 +116,7 @@ def setup_logging() -> None:
     stdout_handler.setLevel(log_level)
     
     # Create stderr log file handler for warnings and above
-    stderr_handler = logging.handlers.RotatingFileHandler(
+    stderr_handler = BufferedRotatingFileHandler(
         stderr_log_file,
         maxBytes=10485760,  # 10MB
         backupCount=3,  # Keep 3 backup files
@@ -84,9 +124,18 @@ def setup_logging() -> None:
     stderr_handler.setFormatter(formatter)
     stderr_handler.setLevel(logging.WARNING)
     
-    # Add handlers to root logger
-    root_logger.addHandler(stdout_handler)
-    root_logger.addHandler(stderr_handler)
+    # Route file logging through a queue so formatting and disk I/O happen on
+    # the listener thread instead of the caller's
+    log_queue = queue.SimpleQueue()
+    _log_queue_handler = logging.handlers.QueueHandler(log_queue)
+    root_logger.addHandler(_log_queue_handler)
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, stdout_handler, stderr_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    # Drain the queue at exit; this runs before logging.shutdown() closes the handlers
+    atexit.unregister(_stop_log_listener)
+    atexit.register(_stop_log_listener)
     
     # Only add console handler if LOG_TO_CONSOLE is set to 1
     if IS_TESTING:
@@ -106,4 +155,24 @@ def setup_logging() -> None:
     logger.debug(f"Standard error logs will be saved to {stderr_log_file}")
     logger.debug(f"Console logging is {'enabled' if os.environ.get('LOG_TO_CONSOLE', '0') == '1' else 'disabled'}")
 
-setup_logging()
\ No newline at end of file
+
+def _stop_log_listener() -> None:
+    """Stop the log listener, writing out any records still in the queue."""
+    # Imported here because importing the src.logging subpackage rebinds the
+    # module-level name logging to it
+    import logging
+
+    global _log_listener, _log_queue_handler
+    if _log_queue_handler is not None:
+        # Records logged later, e.g. by finalizers while the interpreter shuts
+        # down, are dropped as the closed file handlers would drop them
+        logging.getLogger().removeHandler(_log_queue_handler)
+        _log_queue_handler = None
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+# Test harnesses and embedding applications can opt out of global logging setup
+if os.environ.get("NEO_SKIP_LOGSETUP") != "1":
+    setup_logging()
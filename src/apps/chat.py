@@ -1,30 +1,30 @@
 """
 Chat module providing the interactive interface between user and Agent.
 
-This module defines the Chat class which manages the interactive terminal session,
-processes user inputs, displays Agent responses, and handles the CLI interaction flow.
-It serves as the bridge between the Agent's capabilities and the user.
+This module manages the interactive terminal session: it reads user inputs,
+processes them on a worker thread, displays Agent responses, and handles the
+CLI interaction flow. It serves as the bridge between the Agent's capabilities
+and the user.
 """
 
+import asyncio
 import os
 import logging
 import time
 import threading
 import queue
-from typing import Optional
-
-from attr import dataclass
-from prompt_toolkit import PromptSession
-from prompt_toolkit.history import FileHistory
-from prompt_toolkit.patch_stdout import patch_stdout
-from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
-from prompt_toolkit.formatted_text import HTML
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 from src import NEO_HOME
 from src.neo.service.service import Service
 from src.neo.core.messages import Message, TextBlock
 from src.neo.service.session_manager import SessionInfo
-from src.apps.display import print_message, console
+from src.apps.display import StreamingResponse, console, print_message
+
+if TYPE_CHECKING:
+    from prompt_toolkit.completion import WordCompleter
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -40,31 +40,43 @@ COMMANDS = {
     "/set": "Update session settings (e.g., /set workspace <path>)",
 }
 
+# Output of /help, built once from COMMANDS
+HELP_TEXT = "\n".join(
+    [
+        "[bold]Available Commands:[/bold]",
+        *(f"  [blue]{name}[/blue] - {desc}" for name, desc in COMMANDS.items()),
+    ]
+)
+
 # History is stored in NEO_HOME/cli_chat_history
 history_file = os.path.join(NEO_HOME, "cli_chat_history")
 
-prompt_session = PromptSession(
-    message=HTML("\n<ansigreen>></ansigreen> "),
-    history=FileHistory(history_file),
-    auto_suggest=AutoSuggestFromHistory(),
-)
-
 session_id = None
 session_name = None
 workspace = None
+# Output of /info, rebuilt whenever the session changes
+session_info_text = ""
 
 # Track interrupt state
+# A second Ctrl+C within this many nanoseconds of the first exits the chat
+DOUBLE_INTERRUPT_NS = 1_000_000_000
 interrupt_counter = 0
-last_interrupt_time = 0
+# time.monotonic_ns() of the last Ctrl+C, initially far enough back to not count
+last_interrupt_ns = -DOUBLE_INTERRUPT_NS
 
 message_layout = None
 
 
 def _update_session(session_info: SessionInfo) -> None:
-    global session_name, session_id, workspace
+    global session_name, session_id, workspace, session_info_text
     session_name = session_info.session_name
     session_id = session_info.session_id
     workspace = session_info.workspace
+    message_queue.prepare(session_id)
+    session_info_text = (
+        f"[bold]Session:[/bold] {session_name} ([italic]{session_id}[/italic])\n"
+        f"[bold]Workspace:[/bold] {workspace or 'Not set'}"
+    )
 
 
 class MessageQueue:
@@ -72,7 +84,8 @@ class MessageQueue:
     @dataclass
     class Item:
         session_id: str
-        message: str
+        # None only loads the session, ahead of its first message
+        message: Optional[str]
 
     def __init__(self) -> None:
         self._stop_worker = threading.Event()
@@ -91,15 +104,25 @@ class MessageQueue:
         """Worker thread to process and display messages from the queue."""
         logger.info("Message worker thread started")
 
-        while not self._stop_worker.is_set():
+        # Bound once, since they are called for every message the agent returns
+        stop_requested = self._stop_worker.is_set
+        stopping_requested = self._stopping_status.is_set
+        get_message = self._message_queue.get
+        message_done = self._message_queue.task_done
+
+        while not stop_requested():
             # Get a message from the queue with a timeout
             # This allows the thread to check the stop flag periodically
             try:
-                message = self._message_queue.get(timeout=0.1)
+                message = get_message(timeout=0.1)
             except queue.Empty:
                 continue
 
-            self._message_queue.task_done()
+            message_done()
+            if message.message is None:
+                self._prepare(message.session_id)
+                continue
+
             # Process the message and display results
             logger.info(
                 "Worker processing message: %s",
@@ -109,29 +132,56 @@ class MessageQueue:
             status = "[bold green]Processing..."
             try:
                 with console.status(status) as status_display:
-                    # Process through the service
-                    for message in Service.message(
-                        msg=message.message, session_id=message.session_id
-                    ):
-                        # Check if we need to update status to show stopping
-                        if self._stopping_status.is_set():
-                            status_display.update("[bold yellow]Stopping...")
-                            self._stopping_status.clear()  # Reset after updating display
-
-                        print_message(message)
-                        if self._stop_worker.is_set():
-                            break
+                    # Shows the response text while it is generated; replaced by
+                    # the formatted message once the message is complete
+                    streaming = StreamingResponse(status_display)
+                    clear_streaming = streaming.clear
+                    try:
+                        # Process through the service
+                        for message in Service.message(
+                            msg=message.message,
+                            session_id=message.session_id,
+                            on_text=streaming.feed,
+                            on_retry=clear_streaming,
+                        ):
+                            clear_streaming()
+                            # Check if we need to update status to show stopping
+                            if stopping_requested():
+                                status_display.update("[bold yellow]Stopping...")
+                                self._stopping_status.clear()  # Reset after updating display
+
+                            print_message(message)
+                            if stop_requested():
+                                break
+                    finally:
+                        clear_streaming()
             finally:
                 self._idle.set()
 
             # Reset flags after interruption if needed
-            if self._stop_worker.is_set():
+            if stop_requested():
                 logger.info("Resetting worker stop flag after interruption")
                 self._stop_worker.clear()
                 self._stopping_status.clear()  # Also reset stopping status
 
         logger.info("Message worker thread stopped")
 
+    def _prepare(self, session_id: str) -> None:
+        try:
+            Service.prepare_session(session_id)
+        except Exception:
+            # Processing a message loads the session again and reports the error
+            logger.exception("Failed to load session %s ahead of time", session_id)
+
+    def prepare(self, session_id: str) -> None:
+        """
+        Load a session and its agent on the worker thread while the user types.
+
+        Loading runs before any message queued after it, on the same thread, so
+        the first message of a session does not wait for it.
+        """
+        self._message_queue.put(self.Item(session_id=session_id, message=None))
+
     def add_message(self, message: str) -> None:
         self._idle.clear()
         # Add to processing queue
@@ -167,10 +217,10 @@ class MessageQueue:
         # Block until processing stops or timeout occurs
         logger.info("Waiting for current processing to complete...")
         timeout_seconds = 2.0
-        wait_start = time.time()
+        wait_start = time.monotonic()
 
         # Wait until the flag is cleared (indicating processing is done) or timeout
-        while self._stop_worker.is_set() and time.time() - wait_start < timeout_seconds:
+        while self._stop_worker.is_set() and time.monotonic() - wait_start < timeout_seconds:
             time.sleep(0.1)
 
         if self._stop_worker.is_set():
@@ -194,65 +244,110 @@ class MessageQueue:
 message_queue = MessageQueue()
 
 
-def run_processing_loop() -> None:
-    message_queue.start()
-    while True:
-        try:
-            # Create a custom prompt application that will clean up after itself
-            user_input = ""  # Initialize with empty string instead of None to handle slicing operations
-
-            # Create a prompt application that will erase prompt when done
-            def accept_input(buff):
-                nonlocal user_input
-                user_input = buff.text
-                app.exit()
-
-            # Configure session to use our custom accept handler
-            session = PromptSession(
-                message=HTML("\n<ansigreen>></ansigreen> "),
-                history=prompt_session.history,
-                auto_suggest=AutoSuggestFromHistory(),
-            )
+@lru_cache(maxsize=1)
+def _command_completer() -> "WordCompleter":
+    """Completer for the chat commands, built once since COMMANDS is constant."""
+    from prompt_toolkit.completion import WordCompleter
 
-            # Create application with erase_when_done=True
-            app = session.app
-            app.erase_when_done = True
+    # Match the whole input, since commands start with a non-word character
+    return WordCompleter(list(COMMANDS), ignore_case=True, sentence=True)
 
-            # Set accept handler
-            session.default_buffer.accept_handler = accept_input
 
-            # Run the application
-            app.run(in_thread=True)
-
-            # Now we have the user input and the prompt has been erased
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Event loop for the prompt, using uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
 
-            # Reset interrupt counter on successful input
-            global interrupt_counter
-            interrupt_counter = 0
 
-            # Check if this is a special command
-            if user_input.startswith("/"):
-                handle_command(user_input)
-                continue
+def run_processing_loop() -> None:
+    # prompt_toolkit is only needed once the loop starts, so importing this
+    # module does not load it or read the history file
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
+    from prompt_toolkit.formatted_text import HTML
+    from prompt_toolkit.history import ThreadedHistory
+    from prompt_toolkit.patch_stdout import patch_stdout
+
+    from src.apps.history import BackgroundFileHistory
+
+    # Entered lines are appended on a background thread, and the file is read
+    # on another one so a long history does not delay the first prompt
+    history = BackgroundFileHistory(history_file)
+
+    # The prompt session is built once and rerun for every input
+    user_input = ""
+
+    def accept_input(buff):
+        nonlocal user_input
+        user_input = buff.text
+        app.exit()
+
+    session = PromptSession(
+        message=HTML("\n<ansigreen>></ansigreen> "),
+        history=ThreadedHistory(history),
+        auto_suggest=AutoSuggestFromHistory(),
+        completer=_command_completer(),
+    )
+    # Erase the prompt when done
+    app = session.app
+    app.erase_when_done = True
+    session.default_buffer.accept_handler = accept_input
 
-            # Skip empty inputs
-            if not user_input.strip():
-                continue
+    # Every prompt runs on this loop, instead of a new thread and event loop
+    # per input. Messages are processed on the worker thread meanwhile.
+    loop = _new_event_loop()
 
-            # Add message to queue for processing by worker thread
-            message_queue.add_message(user_input)
-            logger.info(
-                "Added message to queue: %s",
-                user_input[:30] + "..." if len(user_input) > 30 else user_input
-            )
+    message_queue.start()
+    try:
+        while True:
+            try:
+                # Empty string instead of None to handle slicing operations
+                user_input = ""
+                # Text typed before an interrupted prompt is not carried over
+                session.default_buffer.reset()
+
+                # Run the application. The worker loads the session while the
+                # prompt is shown, so anything it writes is printed above the
+                # prompt instead of over it.
+                with patch_stdout(raw=True):
+                    loop.run_until_complete(app.run_async())
+
+                # Now we have the user input and the prompt has been erased
+
+                # Reset interrupt counter on successful input
+                global interrupt_counter
+                interrupt_counter = 0
+
+                # Check if this is a special command
+                if user_input.startswith("/"):
+                    handle_command(user_input)
+                    continue
+
+                # Skip empty inputs (isspace avoids copying the input just to test it)
+                if not user_input or user_input.isspace():
+                    continue
+
+                # Add message to queue for processing by worker thread
+                message_queue.add_message(user_input)
+                # Truncated by the format, only if the record is emitted
+                logger.info(
+                    "Added message to queue (%d chars): %.30s", len(user_input), user_input
+                )
 
-            # Block until the message is processed
-            message_queue.join()
+                # Block until the message is processed
+                message_queue.join()
 
-        except KeyboardInterrupt:
-            handle_keyboard_interrupt()
-        except EOFError as exc:  # Ctrl+D during input
-            raise TerminateChat("[bold red]Exiting due to Ctrl+D[/bold red]") from exc
+            except KeyboardInterrupt:
+                handle_keyboard_interrupt()
+            except EOFError as exc:  # Ctrl+D during input
+                raise TerminateChat("[bold red]Exiting due to Ctrl+D[/bold red]") from exc
+    finally:
+        # Entered lines are written in the background; keep them on exit
+        history.commit()
+        loop.close()
 
 
 def handle_keyboard_interrupt() -> None:
@@ -261,13 +356,11 @@ def handle_keyboard_interrupt() -> None:
     On first Ctrl+C: Clear message queue and stop current processing
     On second Ctrl+C (within 1 second): Exit the application
     """
-    global interrupt_counter, last_interrupt_time
-    current_time = time.time()
-    if current_time - last_interrupt_time < 1:
-        interrupt_counter += 1
-    else:
-        interrupt_counter = 1
-    last_interrupt_time = current_time
+    global interrupt_counter, last_interrupt_ns
+    now_ns = time.monotonic_ns()
+    within = now_ns - last_interrupt_ns < DOUBLE_INTERRUPT_NS
+    interrupt_counter = interrupt_counter + 1 if within else 1
+    last_interrupt_ns = now_ns
 
     if interrupt_counter >= 2:
         raise TerminateChat("[bold red]Exiting due to repeated Ctrl+C[/bold red]")
@@ -280,53 +373,49 @@ def handle_keyboard_interrupt() -> None:
         )
 
 
-def handle_command(command: str) -> None:
-    """Process a chat command starting with /."""
-    if not command.startswith("/"):
+def _command_exit(args: str) -> None:
+    """Stop processing and end the chat."""
+    message_queue.stop()
+    raise TerminateChat("[bold red]Exiting chat...[/bold red]")
+
+
+def _command_help(args: str) -> None:
+    """Show the available commands."""
+    console.print(HELP_TEXT)
+
+
+def _command_shell(args: str) -> None:
+    """Run a shell command in the current session."""
+    if not args:
+        console.print("[yellow]Usage: /shell <command> [args][/yellow]")
+        console.print("[yellow]Example: /shell read_file test.py[/yellow]")
         return
 
-    # Split command and args
-    parts = command[1:].split(" ", 1)
-    cmd = parts[0].lower()
-    args = parts[1] if len(parts) > 1 else ""
-
-    if cmd == "exit":
-        message_queue.stop()
-        raise TerminateChat("[bold red]Exiting chat...[/bold red]")
-    elif cmd == "help":
-        console.print("[bold]Available Commands:[/bold]")
-        for command_name, desc in COMMANDS.items():
-            console.print(f"  [blue]{command_name}[/blue] - {desc}")
-    elif cmd == "shell":
-        if not args.strip():
-            console.print("[yellow]Usage: /shell <command> [args][/yellow]")
-            console.print("[yellow]Example: /shell read_file test.py[/yellow]")
-            return
-            
-        try:
-            # Execute the shell command via the service
-            result = Service.execute_shell_command(session_id, args.strip())
-            
-            # Display result using the print_message function
-            print_message(result)
-                
-        except Exception as e:
-            console.print(f"[red]Error executing shell command: {e}[/red]")
-    elif cmd == "info":
-        console.print(
-            f"[bold]Session:[/bold] {session_name} ([italic]{session_id}[/italic])"
-        )
-        if workspace:
-            console.print(f"[bold]Workspace:[/bold] {workspace}")
+    try:
+        # Execute the shell command via the service
+        result = Service.execute_shell_command(session_id, args)
+
+        # Display result using the print_message function
+        print_message(result)
+
+    except Exception as e:
+        console.print(f"[red]Error executing shell command: {e}[/red]")
+
+
+def _command_info(args: str) -> None:
+    """Show the current session."""
+    console.print(session_info_text)
+
+
+def _command_list(args: str) -> None:
+    """List the persistent sessions."""
+    try:
+        sessions = Service.list_sessions()
+        if not sessions:
+            console.print("[yellow]No persistent sessions found.[/yellow]")
         else:
-            console.print("[bold]Workspace:[/bold] Not set")
-    elif cmd == "list":
-        # List all persistent sessions
-        try:
-            sessions = Service.list_sessions()
-            if not sessions:
-                console.print("[yellow]No persistent sessions found.[/yellow]")
-            else:
+            # Written to the terminal at once when the block ends
+            with console:
                 console.print("[bold]Available Sessions:[/bold]")
                 for idx, session in enumerate(sessions, 1):
                     is_current = session.session_id == session_id
@@ -336,103 +425,170 @@ def handle_command(command: str) -> None:
                         f"([italic]{session.session_id[:8]}...[/italic]) "
                         f"- Workspace: {session.workspace or 'None'}"
                     )
-        except Exception as e:
-            console.print(f"[red]Error listing sessions: {e}[/red]")
+    except Exception as e:
+        console.print(f"[red]Error listing sessions: {e}[/red]")
 
-    elif cmd == "switch":
-        if not args:
-            console.print("[yellow]Usage: /switch <session_id>[/yellow]")
-            console.print("Use [blue]/list[/blue] to see available sessions.")
-        else:
-            new_session_name = args.strip()
-            logger.info("Attempting to switch to session %s", new_session_name)
-            if new_session_name == session_name:
-                console.print("[yellow]Already in this session.[/yellow]")
-                return
 
-            try:
-                new_session_info = Service.get_session(new_session_name)
-                if not new_session_info:
-                    console.print(f"[red]Session '{new_session_name}' not found[/red]")
-                    return
-            except Exception as e:
-                console.print(
-                    f"[red]Failed to load session '{new_session_name[:8]}...': {e}[/red]"
-                )
-                return
+def _find_session(target: str) -> Optional[SessionInfo]:
+    """
+    Find a persistent session by ID, name or unique ID prefix, as shown by /list.
 
-            _update_session(new_session_info)
+    Returns None if no session matches, or if the prefix matches several.
+    """
+    # One pass over the sessions; an exact ID wins over a name, and a name
+    # over an ID prefix
+    by_name = None
+    by_prefix = []
+    for session in Service.list_sessions():
+        if session.session_id == target:
+            return session
+        if session.session_name == target:
+            by_name = session
+        elif session.session_id.startswith(target):
+            by_prefix.append(session)
+
+    if by_name is not None:
+        return by_name
+    return by_prefix[0] if len(by_prefix) == 1 else None
+
+
+def _command_switch(args: str) -> None:
+    """Switch to another persistent session."""
+    if not args:
+        console.print("[yellow]Usage: /switch <session_id|name>[/yellow]")
+        console.print("Use [blue]/list[/blue] to see available sessions.")
+    else:
+        new_session_name = args
+        logger.info("Attempting to switch to session %s", new_session_name)
+        if new_session_name == session_name:
+            console.print("[yellow]Already in this session.[/yellow]")
+            return
 
+        try:
+            # Temporary sessions are not listed, but can be switched to by ID
+            new_session_info = _find_session(new_session_name) or Service.get_session(
+                new_session_name
+            )
+            if not new_session_info:
+                console.print(f"[red]Session '{new_session_name}' not found[/red]")
+                return
+        except Exception as e:
             console.print(
-                f"[green]Switched to session: [bold]{session_name}[/bold] (ID: {session_id[:8]}...)[/green]"
+                f"[red]Failed to load session '{new_session_name[:8]}...': {e}[/red]"
             )
-            console.print("---")
-    elif cmd == "new-session":
-        try:
-            # Use current working directory as workspace if not set
-            current_workspace = workspace if workspace else os.getcwd()
+            return
 
-            # Use provided name or let the system generate one
-            new_session_name = args.strip() if args and args.strip() else None
+        if new_session_info.session_id == session_id:
+            console.print("[yellow]Already in this session.[/yellow]")
+            return
 
-            # Create the new session
-            new_session = Service.create_session(new_session_name, current_workspace)
+        _update_session(new_session_info)
 
-            console.print(
-                f"[green]Created new session: [bold]{new_session.session_name}[/bold] (ID: {new_session.session_id})[/green]"
-            )
-            console.print(f"[green]Workspace: [bold]{current_workspace}[/bold][/green]")
+        console.print(
+            f"[green]Switched to session: [bold]{session_name}[/bold] (ID: {session_id[:8]}...)[/green]"
+        )
+        console.print("---")
 
-            _update_session(new_session)
-        except Exception as e:
-            console.print(f"[red]Failed to create session: {e}[/red]")
-    elif cmd == "set":
-        if not args or " " not in args:
-            console.print("[yellow]Usage: /set <setting> <value>[/yellow]")
-            console.print("[yellow]Available settings: workspace[/yellow]")
-        else:
-            # Split into setting name and value
-            parts = args.split(" ", 1)
-            setting = parts[0].lower()
-            value = parts[1].strip()
 
-            try:
-                if setting == "workspace":
-                    # Verify the workspace path exists
-                    if not os.path.isdir(value):
-                        console.print(
-                            f"[red]Invalid workspace path: '{value}' is not a directory[/red]"
-                        )
-                        return
-
-                    # Get absolute path
-                    abs_path = os.path.abspath(value)
-
-                    # Update session workspace
-                    updated_session = Service.update_session(
-                        session_id, workspace=abs_path
+def _command_new_session(args: str) -> None:
+    """Create a new session and switch to it."""
+    try:
+        # Use current working directory as workspace if not set
+        current_workspace = workspace if workspace else os.getcwd()
+
+        # Use provided name or let the system generate one
+        new_session_name = args or None
+
+        # Create the new session
+        new_session = Service.create_session(new_session_name, current_workspace)
+
+        console.print(
+            f"[green]Created new session: [bold]{new_session.session_name}[/bold] (ID: {new_session.session_id})[/green]"
+        )
+        console.print(f"[green]Workspace: [bold]{current_workspace}[/bold][/green]")
+
+        _update_session(new_session)
+    except Exception as e:
+        console.print(f"[red]Failed to create session: {e}[/red]")
+
+
+def _command_set(args: str) -> None:
+    """Update a session setting."""
+    if not args or " " not in args:
+        console.print("[yellow]Usage: /set <setting> <value>[/yellow]")
+        console.print("[yellow]Available settings: workspace[/yellow]")
+    else:
+        # Split into setting name and value
+        parts = args.split(" ", 1)
+        setting = parts[0].lower()
+        value = parts[1].strip()
+
+        try:
+            if setting == "workspace":
+                # Verify the workspace path exists
+                if not os.path.isdir(value):
+                    console.print(
+                        f"[red]Invalid workspace path: '{value}' is not a directory[/red]"
                     )
+                    return
 
-                    if not updated_session:
-                        console.print(
-                            f"[red]Failed to update workspace: Session '{session_id}' not found[/red]"
-                        )
-                        return
+                # Get absolute path
+                abs_path = os.path.abspath(value)
 
-                    # Update session info in the application
-                    _update_session(updated_session)
+                # Update session workspace
+                updated_session = Service.update_session(
+                    session_id, workspace=abs_path
+                )
 
+                if not updated_session:
                     console.print(
-                        f"[green]Workspace updated to: [bold]{abs_path}[/bold][/green]"
+                        f"[red]Failed to update workspace: Session '{session_id}' not found[/red]"
                     )
-                else:
-                    console.print(f"[red]Unknown setting: {setting}[/red]")
-                    console.print("[yellow]Available settings: workspace[/yellow]")
-            except Exception as e:
-                console.print(f"[red]Error updating setting: {e}[/red]")
-    else:
-        console.print(f"[red]Unknown command: {cmd}[/red]")
+                    return
+
+                # Update session info in the application
+                _update_session(updated_session)
+
+                console.print(
+                    f"[green]Workspace updated to: [bold]{abs_path}[/bold][/green]"
+                )
+            else:
+                console.print(f"[red]Unknown setting: {setting}[/red]")
+                console.print("[yellow]Available settings: workspace[/yellow]")
+        except Exception as e:
+            console.print(f"[red]Error updating setting: {e}[/red]")
+
+
+# Handler of each chat command, keyed by the same names as COMMANDS, which
+# include the leading /
+COMMAND_HANDLERS = {
+    "/exit": _command_exit,
+    "/help": _command_help,
+    "/shell": _command_shell,
+    "/info": _command_info,
+    "/list": _command_list,
+    "/switch": _command_switch,
+    "/new-session": _command_new_session,
+    "/set": _command_set,
+}
+
+
+def handle_command(command: str) -> None:
+    """Process a chat command starting with /."""
+    if not command.startswith("/"):
+        return
+
+    # Split command and args; args are stripped once here for all handlers
+    parts = command.split(" ", 1)
+    cmd = parts[0].lower()
+    args = parts[1].strip() if len(parts) > 1 else ""
+
+    handler = COMMAND_HANDLERS.get(cmd)
+    if handler is None:
+        console.print(f"[red]Unknown command: {cmd[1:]}[/red]")
         console.print("Use [blue]/help[/blue] to see available commands.")
+        return
+    handler(args)
 
 
 class TerminateChat(Exception):
@@ -453,24 +609,17 @@ def launch() -> None:
     _update_session(session_info)
 
     # Display welcome message with optional workspace information
-    console.print(f"Session: [cyan]{session_name}[/cyan] (ID: {session_id})")
-
-    if workspace:
-        console.print(f"Workspace: [blue]{workspace}[/blue]")
-    else:
-        console.print("Workspace: [yellow]Not set[/yellow]")
-
+    workspace_text = f"[blue]{workspace}[/blue]" if workspace else "[yellow]Not set[/yellow]"
     console.print(
+        f"Session: [cyan]{session_name}[/cyan] (ID: {session_id})\n"
+        f"Workspace: {workspace_text}\n"
         "Type [blue]/help[/blue] for commands, [blue]/exit[/blue] or [blue]Ctrl+D[/blue] to quit."
     )
 
-    # Main chat loop (UI thread)
+    # Main chat loop (UI thread). Unexpected errors are logged by the caller.
     try:
         run_processing_loop()
     except TerminateChat as e:
         console.print(e.message)
-    except Exception as e:
-        logger.exception("Unexpected error in chat loop", exc_info=True)
-        console.print(f"[red]An unexpected error occurred: {e}[/red]")
 
     logger.info("Interactive chat session ended.")
\ No newline at end of file
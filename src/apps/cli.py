@@ -10,16 +10,9 @@ import os
 import sys
 import argparse
 import logging
-from dotenv import load_dotenv
-
-
 
 # Logging is configured in src/__init__.py when imported
-from src.neo.service.service import Service
-
-
-# Import launch function directly from chat module
-from src.apps.chat import launch
+from src import ensure_env
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -51,7 +44,7 @@ class CLI:
         try:
             # Load environment variables from .env file
             dotenv_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '.env')
-            load_dotenv(dotenv_path)
+            ensure_env(dotenv_path)
             logger.info("Loaded environment from: %s", dotenv_path)
 
             
@@ -60,68 +53,7 @@ class CLI:
 
 
             # Execute the appropriate subcommand
-            if args.subcommand == "chat":
-                workspace = args.workspace or os.getcwd()
-                logger.info(
-                    "Starting interactive chat for workspace: %s", workspace
-                )
-
-                # Use the launch function directly from the chat module
-                try:
-                    # Session creation is handled within launch function
-                    launch()
-                except Exception as e:  # pylint: disable=broad-except
-                    logger.error("Error in chat launch: %s", str(e), exc_info=True)
-                    print(f"\nEncountered an error: {e}")
-
-
-
-            elif args.subcommand == "create-session":
-                # Create a new session using Service's async method
-                logger.info(
-                    "Using workspace: %s to create session '%s'", 
-                    args.workspace, args.session
-                )
-
-                session = Service.create_session(
-                    session_name=args.session, workspace=args.workspace
-                )
-                print(
-                    f"Session '{session.session_name}' created successfully "
-                    + f"(Session ID: {session.session_id})"
-                )
-                print(f"Workspace: {session.workspace}")
-            elif args.subcommand == "message":
-                # Process a single message using the Service class method
-                session_id = None
-                
-                if args.session:
-                    logger.info("Processing message for session '%s'", args.session)
-
-                    # If session is specified then try to find it by listing sessions and matching the name
-                    all_sessions = Service.list_sessions()
-                    
-                    for session in all_sessions:
-                        if session.session_name == args.session:
-                            session_id = session.session_id
-                            break
-                    
-                    if not session_id:
-                        print(f"Error: Session '{args.session}' not found.")
-                        logger.error("Session '%s' not found for message command.", args.session)
-
-                        sys.exit(1)
-
-                # Use the Service.message method with the session_id
-                for message in Service.message(msg=args.message, session_id=session_id):
-                    print(message)
-            elif args.subcommand == "list-sessions":
-                logger.info("Listing persistent sessions.")
-                sessions = Service.list_sessions()
-                for session in sessions:
-                    print(
-                        f"Session ID: {session.session_id}, Name: {session.session_name}, Workspace: {session.workspace}"
-                    )
+            SUBCOMMAND_HANDLERS[args.subcommand](args)
 
         except KeyboardInterrupt:
             # Handle Ctrl+C in the main thread
@@ -193,9 +125,102 @@ class CLI:
             help="Name of the session to use (optional, will create a temporary session if not provided)",
         )
 
+        # 4. List-sessions subcommand - list persistent sessions
+        subparsers.add_parser("list-sessions", help="List persistent sessions")
+
         return parser.parse_args()
 
 
+def _subcommand_chat(args: argparse.Namespace) -> None:
+    """Start an interactive chat session."""
+    workspace = args.workspace or os.getcwd()
+    logger.info(
+        "Starting interactive chat for workspace: %s", workspace
+    )
+
+    # Imported here so the other subcommands do not load the
+    # terminal UI libraries the chat module depends on
+    from src.apps.chat import launch
+
+    # Use the launch function directly from the chat module
+    try:
+        # Session creation is handled within launch function
+        launch()
+    except Exception as e:  # pylint: disable=broad-except
+        logger.error("Error in chat launch: %s", str(e), exc_info=True)
+        print(f"\nEncountered an error: {e}")
+
+
+def _subcommand_create_session(args: argparse.Namespace) -> None:
+    """Create a new persistent session."""
+    # The service and its database are imported by the subcommands that use
+    # them, so --help and argument errors do not load them
+    from src.neo.service.service import Service
+
+    logger.info(
+        "Using workspace: %s to create session '%s'", 
+        args.workspace, args.session
+    )
+
+    session = Service.create_session(
+        session_name=args.session, workspace=args.workspace
+    )
+    print(
+        f"Session '{session.session_name}' created successfully "
+        + f"(Session ID: {session.session_id})"
+    )
+    print(f"Workspace: {session.workspace}")
+
+
+def _subcommand_message(args: argparse.Namespace) -> None:
+    """Process a single message and print the responses."""
+    from src.neo.service.service import Service
+
+    session_id = None
+    
+    if args.session:
+        logger.info("Processing message for session '%s'", args.session)
+
+        # If session is specified then try to find it by listing sessions and matching the name
+        all_sessions = Service.list_sessions()
+        
+        for session in all_sessions:
+            if session.session_name == args.session:
+                session_id = session.session_id
+                break
+        
+        if not session_id:
+            print(f"Error: Session '{args.session}' not found.")
+            logger.error("Session '%s' not found for message command.", args.session)
+
+            sys.exit(1)
+
+    # Use the Service.message method with the session_id
+    for message in Service.message(msg=args.message, session_id=session_id):
+        print(message)
+
+
+def _subcommand_list_sessions(args: argparse.Namespace) -> None:
+    """List the persistent sessions."""
+    from src.neo.service.service import Service
+
+    logger.info("Listing persistent sessions.")
+    sessions = Service.list_sessions()
+    for session in sessions:
+        print(
+            f"Session ID: {session.session_id}, Name: {session.session_name}, Workspace: {session.workspace}"
+        )
+
+
+# Handler for each subcommand, called with the parsed arguments
+SUBCOMMAND_HANDLERS = {
+    "chat": _subcommand_chat,
+    "create-session": _subcommand_create_session,
+    "message": _subcommand_message,
+    "list-sessions": _subcommand_list_sessions,
+}
+
+
 def main() -> None:
     """
     Main entry point for the application.
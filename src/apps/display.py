@@ -6,13 +6,16 @@ and other UI elements in a consistent way across the application.
 """
 
 import logging
+import threading
 from datetime import datetime
-from typing import List, Any
+from typing import TYPE_CHECKING, List, Any, Optional
 
 from rich.console import Console
 from rich.panel import Panel
-from rich.markdown import Markdown
 
+if TYPE_CHECKING:
+    from rich.live import Live
+    from rich.status import Status
 
 from src.neo.core.messages import Message, CommandCall
 
@@ -22,15 +25,38 @@ logger = logging.getLogger(__name__)
 # Initialize console with soft-wrapping and highlighting
 console = Console(soft_wrap=True, highlight=True)
 
+# Panel styles shared by every message of the same kind
+_USER_PANEL_STYLE = {"border_style": "blue", "padding": (0, 1), "expand": True}
+_OUTPUT_PANEL_STYLE = {"border_style": "green", "padding": (0, 1)}
+_CONSOLE_PANEL_STYLE = {"border_style": "blue", "padding": (0, 1)}
+
+# Icons shown next to the output of each command
+_COMMAND_ICONS = {
+    "file_path_search": "🔍",
+    "file_text_search": "🔍",
+    "read_file": "📖",
+    "wait": "⏱️",
+    "web_search": "🌐",
+    "web_markdown": "🌐",
+}
+
+
+def _panel_width() -> int:
+    """Width of a panel that fits the terminal, accounting for borders and padding."""
+    return (console.width or 80) - 4
+
 
 def print_message(message: Message) -> None:
     """Display a message with appropriate formatting based on its role and content."""
     timestamp = datetime.now().strftime("%H:%M:%S")
-    
-    if message.role == "user":  # User message
-        _print_user_message(message, timestamp)
-    else:  # Agent message
-        _print_agent_message(message)
+
+    # The console buffers everything printed inside the with block and writes
+    # it to the terminal at once, instead of once per print
+    with console:
+        if message.role == "user":  # User message
+            _print_user_message(message, timestamp)
+        else:  # Agent message
+            _print_agent_message(message)
 
 
 def _print_user_message(message: Message, timestamp: str) -> None:
@@ -42,9 +68,7 @@ def _print_user_message(message: Message, timestamp: str) -> None:
         Panel(
             renderable=content,
             title=f"[dim]({timestamp})[/dim]",
-            border_style="blue",
-            padding=(0, 1),
-            expand=True,
+            **_USER_PANEL_STYLE,
         ),
         soft_wrap=False,
     )
@@ -72,15 +96,15 @@ def _print_agent_message(message: Message) -> None:
 
 def _print_structured_output(structured_output: Any) -> None:
     """Display structured output in a panel."""
-    console_width = console.width if console.width else 80
-    max_width = console_width - 4  # Account for panel borders and padding
-    
+    # rich.markdown pulls in the markdown parser and pygments, so it is only
+    # imported once something is rendered as markdown
+    from rich.markdown import Markdown
+
     console.print(
         Panel(
             renderable=Markdown(structured_output.value),
-            border_style="green",
-            padding=(0, 1),
-            width=max_width,
+            width=_panel_width(),
+            **_OUTPUT_PANEL_STYLE,
         ),
         soft_wrap=False,
     )
@@ -117,9 +141,6 @@ def _print_file_update(cmd_output: Any) -> None:
     
     # Only show diff if it's not empty
     if cmd_output.diff.strip():
-        console_width = console.width if console.width else 80
-        max_width = console_width - 4
-        
         # Colorize the diff output
         colorized_lines = []
         for line in cmd_output.diff.splitlines():
@@ -140,9 +161,8 @@ def _print_file_update(cmd_output: Any) -> None:
             Panel(
                 colorized_diff,
                 title="[bold]Diff[/bold]",
-                border_style="green",
-                padding=(0, 1),
-                width=max_width,
+                width=_panel_width(),
+                **_OUTPUT_PANEL_STYLE,
             )
         )
 
@@ -153,30 +173,19 @@ def _print_shell_output(cmd_output: Any) -> None:
     
     # Only show console output if it's not empty
     if cmd_output.console.strip():
-        console_width = console.width if console.width else 80
-        max_width = console_width - 4
         console.print(
             Panel(
                 cmd_output.console,
                 title="[bold]Console Output[/bold]",
-                border_style="blue",
-                padding=(0, 1),
-                width=max_width,
+                width=_panel_width(),
+                **_CONSOLE_PANEL_STYLE,
             )
         )
 
 
 def _get_command_icon(cmd_name: str) -> str:
     """Get an appropriate icon based on command name."""
-    icons = {
-        "file_path_search": "🔍",
-        "file_text_search": "🔍",
-        "read_file": "📖",
-        "wait": "⏱️",
-        "web_search": "🌐",
-        "web_markdown": "🌐",
-    }
-    return icons.get(cmd_name, "\u2705")
+    return _COMMAND_ICONS.get(cmd_name, "\u2705")
 
 
 def _print_generic_command_output(cmd_output: Any) -> None:
@@ -187,6 +196,8 @@ def _print_generic_command_output(cmd_output: Any) -> None:
 
 def _print_regular_message_content(message: Message) -> None:
     """Display regular message content excluding CommandCall blocks."""
+    from rich.markdown import Markdown
+
     # Create a filtered version of the message without CommandCall blocks
     filtered_content = [
         block for block in message.content if not isinstance(block, CommandCall)
@@ -202,4 +213,124 @@ def _print_regular_message_content(message: Message) -> None:
             ),
             soft_wrap=False,
         )
-    # If there's no content after filtering, don't display anything
\ No newline at end of file
+    # If there's no content after filtering, don't display anything
+
+class StreamingResponse:
+    """
+    Shows the text of a response in a live region of the terminal while it is
+    streamed. The region is transient: clear() removes it, so the complete
+    message can then be displayed with print_message.
+
+    feed only queues the text; a render thread started with the live region
+    parses and draws it, so receiving the stream does not wait on the
+    terminal. The thread renders at most every REFRESH_INTERVAL seconds, and
+    chunks received in between are coalesced. Blocks that are complete
+    (followed by a blank line outside a code fence) are parsed once and reused
+    by later renders, so each render only parses the block still being written.
+
+    feed and clear are called from the thread that receives the stream.
+    """
+
+    # Minimum number of seconds between two renders of the streamed text
+    REFRESH_INTERVAL = 1 / 15
+
+    def __init__(self, status: Optional["Status"] = None):
+        """
+        Args:
+            status: Status spinner to pause while text is shown, since only one
+                live region can be active at a time
+        """
+        self._status = status
+        self._live: Optional["Live"] = None
+        # Chunks received since the last render, shared with the render thread
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+        self._render_thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        # Owned by the render thread while it runs
+        self._text = ""
+        # Parsed complete blocks, and the length of the text they cover
+        self._blocks: List[Any] = []
+        self._blocks_end = 0
+
+    def feed(self, text: str) -> None:
+        """Add streamed text, to be shown by the next render."""
+        with self._lock:
+            self._pending.append(text)
+        if self._render_thread is None:
+            self._start()
+        self._wake.set()
+
+    def _start(self) -> None:
+        from rich.live import Live
+
+        if self._status is not None:
+            self._status.stop()
+        # Refreshed only by the render thread
+        self._live = Live(console=console, auto_refresh=False, transient=True)
+        self._live.start()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._render_thread = threading.Thread(
+            target=self._render_loop,
+            args=(self._wake, self._stop),
+            name="StreamingRender",
+            daemon=True,
+        )
+        self._render_thread.start()
+
+    def _render_loop(self, wake: threading.Event, stop: threading.Event) -> None:
+        while True:
+            wake.wait()
+            if stop.is_set():
+                return
+            wake.clear()
+            self._render_pending()
+            if stop.wait(self.REFRESH_INTERVAL):
+                return
+
+    def _render_pending(self) -> None:
+        """Render the text received so far, if any arrived since the last render."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+        self._text += "".join(pending)
+        self._live.update(self._render(), refresh=True)
+
+    def _render(self) -> Any:
+        from rich.console import Group
+        from rich.markdown import Markdown
+        from rich.text import Text
+
+        text = self._text
+        split = text.rfind("\n\n", self._blocks_end)
+        if split > self._blocks_end:
+            block = text[self._blocks_end : split]
+            # The text before the block has balanced fences, so the block must too
+            if block.count("```") % 2 == 0:
+                self._blocks.append(Markdown(block))
+                self._blocks.append(Text())
+                self._blocks_end = split + 2
+
+        return Group(*self._blocks, Markdown(text[self._blocks_end :]))
+
+    def clear(self) -> None:
+        """Remove the streamed text and resume the status spinner."""
+        if self._render_thread is not None:
+            self._stop.set()
+            self._wake.set()
+            # Waits for a render in progress at most
+            self._render_thread.join()
+            self._render_thread = None
+        self._pending = []
+        self._text = ""
+        self._blocks.clear()
+        self._blocks_end = 0
+        if self._live is None:
+            return
+        self._live.stop()
+        self._live = None
+        if self._status is not None:
+            self._status.start()
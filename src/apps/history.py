@@ -0,0 +1,154 @@
+"""
+Prompt history for the interactive chat.
+
+prompt_toolkit's FileHistory reads the whole history file when the prompt
+starts and appends to it on the prompt thread every time a line is entered.
+The history here reads only the newest entries, from the end of the file, and
+queues new entries for a background thread that writes them in the same
+file format.
+"""
+
+import datetime
+import io
+import logging
+import os
+import queue
+import threading
+from typing import BinaryIO, Iterable, List, Optional
+
+from prompt_toolkit.history import FileHistory
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+# Size of the blocks in which the history file is read backwards
+READ_CHUNK_SIZE = 4096
+
+# Marks the start of every entry in the history file
+_ENTRY_HEADER = b"\n# "
+
+# The writer appends with os.write on a raw descriptor kept open between batches
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+
+
+class BoundedFileHistory(FileHistory):
+    """
+    FileHistory that loads only the newest max_entries entries.
+
+    The file is read backwards from its end until enough entries are found, so
+    loading takes the same time however long the history has grown. The
+    limit defaults to the NEO_MAX_HISTORY environment variable, or 5000.
+    """
+
+    def __init__(self, filename: str, max_entries: Optional[int] = None) -> None:
+        super().__init__(filename)
+        if max_entries is None:
+            max_entries = int(os.environ.get("NEO_MAX_HISTORY", "5000"))
+        self.max_entries = max_entries
+
+    def load_history_strings(self) -> Iterable[str]:
+        try:
+            with open(self.filename, "rb") as f:
+                data = _read_tail(f, self.max_entries)
+        except FileNotFoundError:
+            return []
+
+        strings: List[str] = []
+        lines: List[str] = []
+        # Split on \n only, like FileHistory
+        for line_bytes in io.BytesIO(data):
+            line = line_bytes.decode("utf-8", errors="replace")
+            if line.startswith("+"):
+                lines.append(line[1:])
+            else:
+                if lines:
+                    # Join and drop the trailing newline
+                    strings.append("".join(lines)[:-1])
+                lines = []
+        if lines:
+            strings.append("".join(lines)[:-1])
+
+        # Newest entries go first
+        return strings[: -self.max_entries - 1 : -1]
+
+
+class BackgroundFileHistory(BoundedFileHistory):
+    """
+    FileHistory whose new entries are written by a daemon thread.
+
+    Entries queued while a write is in progress are written together with a
+    single write to the file, which the thread keeps open. The thread does not
+    outlive the interpreter, so call commit before exiting to wait for queued
+    entries.
+    """
+
+    def __init__(self, filename: str, max_entries: Optional[int] = None) -> None:
+        super().__init__(filename, max_entries)
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._write_entries, name="HistoryWriter", daemon=True
+        )
+        self._writer.start()
+
+    def store_string(self, string: str) -> None:
+        self._queue.put(string)
+
+    def commit(self) -> None:
+        """Wait until all entries stored so far have been written."""
+        self._queue.join()
+
+    def _write_entries(self) -> None:
+        fd: Optional[int] = None
+        while True:
+            strings = [self._queue.get()]
+            while True:
+                try:
+                    strings.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                if fd is None:
+                    fd = os.open(self.filename, _APPEND_FLAGS, 0o666)
+                data = memoryview(b"".join(_format_entry(string) for string in strings))
+                while data:
+                    data = data[os.write(fd, data):]
+            except Exception as e:
+                # The thread has to survive, or commit would wait forever
+                logger.error("Error writing chat history: %s", e)
+                if fd is not None:
+                    # Reopened for the next batch
+                    os.close(fd)
+                    fd = None
+            finally:
+                for _ in strings:
+                    self._queue.task_done()
+
+
+def _read_tail(f: BinaryIO, count: int) -> bytes:
+    """Read the end of a history file holding at least its last count entries."""
+    pos = f.seek(0, os.SEEK_END)
+    data = b""
+    num_headers = 0
+    while pos > 0 and num_headers <= count:
+        size = min(READ_CHUNK_SIZE, pos)
+        pos -= size
+        f.seek(pos)
+        chunk = f.read(size)
+        # Headers split across the chunk boundary are counted with this chunk
+        num_headers += (chunk + data[: len(_ENTRY_HEADER) - 1]).count(_ENTRY_HEADER)
+        data = chunk + data
+
+    if pos > 0:
+        # Drop the partial entry in front of the first complete one
+        data = data[data.index(_ENTRY_HEADER) :]
+    return data
+
+
+def _format_entry(string: str) -> bytes:
+    """Format a history entry the way FileHistory.store_string writes it."""
+    lines: List[str] = [f"\n# {datetime.datetime.now()}\n"]
+    lines.extend(f"+{line}\n" for line in string.split("\n"))
+    # Lone surrogates from pasted input are replaced, as they are when reading
+    return "".join(lines).encode("utf-8", errors="replace")
@@ -9,6 +9,7 @@ import json
 import datetime
 import uuid
 import yaml
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 
@@ -134,16 +135,24 @@ class WebChat:
             # Get the agent for this session
             agent = self._get_agent(session_id)
             
-            # Process the message
-            response = agent.process(message)
-            
+            # Process the message, keeping only the text the assistant wrote.
+            # Command calls and their results are not part of the chat history.
+            response = "\n".join(
+                block.model_text()
+                for msg in agent.process(message)
+                if msg.role == "assistant"
+                for block in msg.content
+                if isinstance(block, TextBlock)
+            ).strip()
+
             # Store messages in database through fallback mechanism
-            # This is needed until messages are properly managed through Service
-            from src.database.database import Database
-            db = Database()
-            db.add_message(session_id, "user", message)
-            db.add_message(session_id, "assistant", response)
-            
+            # This is needed until messages are properly managed through Service.
+            # Exchanges without any response text are not worth a write.
+            if response:
+                db = Database()
+                db.add_message(session_id, "user", message)
+                db.add_message(session_id, "assistant", response)
+
             return response
         except Exception as e:
             logger.error("Error in process_message: %s", str(e), exc_info=True)
@@ -341,7 +350,7 @@ def _get_log_files(session_id: str) -> List[Dict[str, Any]]:
         )
 
     # Sort by modification time (newest first)
-    log_files.sort(key=lambda x: x["modified"], reverse=True)
+    log_files.sort(key=itemgetter("modified"), reverse=True)
     return log_files
 
 
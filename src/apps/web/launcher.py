@@ -15,19 +15,20 @@ from typing import Optional
 # Default port for the web server
 DEFAULT_PORT = 8888
 
+# Directory holding the web server's PID and log files
+_WEB_DIR = Path(os.path.expanduser("~")) / ".neo" / "web"
+
 
 def _get_pid_file_path() -> Path:
     """Get the path to the PID file for the web server."""
-    pid_dir = Path(os.path.expanduser("~")) / ".neo" / "web"
-    pid_dir.mkdir(parents=True, exist_ok=True)
-    return pid_dir / "server.pid"
+    _WEB_DIR.mkdir(parents=True, exist_ok=True)
+    return _WEB_DIR / "server.pid"
 
 
 def _get_log_file_path() -> Path:
     """Get the path to the log file for the web server."""
-    log_dir = Path(os.path.expanduser("~")) / ".neo" / "web"
-    log_dir.mkdir(parents=True, exist_ok=True)
-    return log_dir / "server.log"
+    _WEB_DIR.mkdir(parents=True, exist_ok=True)
+    return _WEB_DIR / "server.log"
 
 
 def _read_pid() -> Optional[int]:
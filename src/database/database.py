@@ -18,6 +18,11 @@ from src import NEO_HOME
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Absolute paths of databases whose directory and schema were already created
+# by this process. Database is constructed per request in places, and creating
+# them again would stat the directory and run the schema DDL each time.
+_initialized_paths = set()
+
 
 class Database:
     """SQLite database for storing application state"""
@@ -32,9 +37,12 @@ class Database:
 
     def _init_db(self) -> None:
         """Initialize the database schema if it doesn't exist"""
+        abs_path = os.path.abspath(self.db_path)
+        if abs_path in _initialized_paths:
+            return
         try:
             # Ensure the directory exists
-            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            os.makedirs(os.path.dirname(abs_path), exist_ok=True)
 
             # Connect to DB and create tables if they don't exist
             with sqlite3.connect(self.db_path) as conn:
@@ -84,6 +92,7 @@ class Database:
 
                 conn.commit()
                 logger.info("Database initialized successfully")
+            _initialized_paths.add(abs_path)
         except sqlite3.Error as e:
             logger.error("Error initializing database: %s", e)
             raise
@@ -12,17 +12,25 @@ import os
 import weakref
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, TextIO
+from typing import Any, BinaryIO, Dict, Optional
 from src import NEO_HOME
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Contents of a log file without any entries
+EMPTY_LOG = b"[\n]"
+
+
+def _close_file(file: BinaryIO) -> None:
+    if not file.closed:
+        file.close()
+
 
 class LogFile:
     """Class representing a log file with its empty status and file handle."""
 
-    def __init__(self, is_empty: bool, file: TextIO):
+    def __init__(self, is_empty: bool, file: BinaryIO):
         self.is_empty = is_empty
         self._file = file
 
@@ -41,37 +49,38 @@ class LogFile:
         # Ensure the log directory exists
         log_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Check if the file exists
-        file_exists = log_file_path.exists()
-
-        # Initialize the log file if it doesn't exist
-        if not file_exists:
-            # Initialize with an empty array for JSON
-            with open(log_file_path, "w", encoding="utf-8") as f:
-                f.write("[\n")
-                f.write("]")
-            # File is technically not empty, but we'll treat it as empty for append logic
-            is_empty = True
-        else:
-            # Check if file is empty
-            is_empty = os.path.getsize(log_file_path) == 0
-
-        # Open the file for read/write
-        if is_empty:
-            file = open(log_file_path, "r+", encoding="utf-8")
-            # Move to the beginning of file, after the opening bracket
+        # Open the file for read/write, creating it if it doesn't exist. Binary
+        # mode keeps seeking relative to the current position cheap, unlike the
+        # opaque positions of text files.
+        try:
+            file = open(log_file_path, "r+b")
+        except FileNotFoundError:
+            file = open(log_file_path, "w+b")
+
+        # Seeking to the end gives the size without stat-ing the file again
+        size = file.seek(0, os.SEEK_END)
+
+        if size <= len(EMPTY_LOG):
+            # New, empty, or initialized without entries: (re)write the empty
+            # JSON array and insert the first entry after the opening bracket
+            file.seek(0)
+            file.write(EMPTY_LOG)
+            file.truncate()
+            file.flush()
             file.seek(2)  # Skip past the "[\n"
+            is_empty = True
         else:
             # If file exists and has content, we need to insert before the closing bracket
-            file = open(log_file_path, "r+", encoding="utf-8")
-            # Move to the second-to-last character (before the closing bracket)
-            file.seek(os.path.getsize(log_file_path) - 1)
-
-        # Register a finalizer to close the file when it's garbage collected
-        weakref.finalize(file, lambda f: f.close() if not f.closed else None, file)
+            file.seek(size - 1)
+            is_empty = False
 
         # Create the log file object with the open file handle
-        return LogFile(is_empty=is_empty, file=file)
+        log_file = LogFile(is_empty=is_empty, file=file)
+
+        # Close the file once the log file is evicted from the cache and collected,
+        # or at exit. A finalizer holding the file itself would keep it alive.
+        weakref.finalize(log_file, _close_file, file)
+        return log_file
 
     def add_document(self, data: Dict[str, Any]) -> None:
         """Add a new JSON entry to the log file.
@@ -79,31 +88,20 @@ class LogFile:
         Args:
             data: Dictionary data to log as a new entry
         """
-        if self.is_empty:
-            # If file was initialized but empty, we'll write directly after the opening bracket
-            document_content = json.dumps(data, indent=2)
-            self._file.write(document_content)
-            # Write the closing bracket
-            self._file.write("\n]")
-            # Ensure content is written to disk
-            self._file.flush()
-            # Rewind to overwrite the closing bracket for future appends
-            self._file.seek(self._file.tell() - 1)
-        else:
-            # If file already has content, add a comma and the new entry
-            document_content = json.dumps(data, indent=2)
-            self._file.write(",\n")
-            self._file.write(document_content)
-            # Write the closing bracket
-            self._file.write("\n]")
-            # Ensure content is written to disk
-            self._file.flush()
-            # Rewind to overwrite the closing bracket for future appends
-            self._file.seek(self._file.tell() - 1)
-
-        # If writing to an empty file, update is_empty
-        if self.is_empty:
-            self.is_empty = False
+        document_content = json.dumps(data, indent=2)
+        # If file was initialized but empty, we'll write directly after the opening
+        # bracket; otherwise add a comma before the new entry
+        separator = "" if self.is_empty else ",\n"
+
+        # Write the entry and the closing bracket with a single write so the file
+        # is valid JSON after every entry
+        self._file.write(f"{separator}{document_content}\n]".encode("utf-8"))
+        # Ensure content is written to disk
+        self._file.flush()
+        # Rewind to overwrite the closing bracket for future appends
+        self._file.seek(-1, os.SEEK_CUR)
+
+        self.is_empty = False
 
 
 class StructuredLogger:
@@ -115,20 +113,27 @@ class StructuredLogger:
     complex nested data structures.
     """
 
-    def record(self, logger_name: str, data: Dict[str, Any]) -> None:
+    def record(
+        self,
+        logger_name: str,
+        data: Dict[str, Any],
+        timestamp: Optional[datetime.datetime] = None,
+    ) -> None:
         """
         Record structured data as a new JSON entry.
 
         Args:
             logger_name: Name of the logger, used as file name
             data: Dictionary of structured data to log
+            timestamp: Time of the logged event, for callers that already read
+                the clock. Defaults to now.
         """
         # Extract session_id from data or use "unknown"
         session_id = data.get("session_id", "unknown")
 
         # Add timestamp if not already present
         if "timestamp" not in data:
-            data["timestamp"] = datetime.datetime.now().isoformat()
+            data["timestamp"] = (timestamp or datetime.datetime.now()).isoformat()
 
         log_dir = Path(NEO_HOME) / f"{session_id}"
         log_file_path = log_dir / f"{logger_name}.json"
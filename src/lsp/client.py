@@ -261,7 +261,7 @@ class LSPClient:
             return None
 
         # Wait for response with timeout
-        start_time = time.time()
+        start_time = time.monotonic()
         if response_event.wait(timeout):
             # Response received
             response = response_container[0]
@@ -270,7 +270,7 @@ class LSPClient:
             return response
         else:
             # Timeout occurred
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             logger.error(f"{method} request (id={request_id}) timed out after {elapsed:.1f} seconds")
             del self._pending_requests[request_id]
             return None
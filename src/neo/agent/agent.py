@@ -4,20 +4,62 @@ With added support for hierarchical memory management for enhanced context reten
 
 import logging
 import os
+import time
+from functools import lru_cache
 from textwrap import dedent
-from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from numpy import isin
+from src.neo.agent.asm import AgentStateMachine, load_prompt
+from src.neo.agent.journal import StateJournal
+from src.neo.agent.marshal import marshal_rows, unmarshal_rows
+from src.neo.agent.state import AgentState
+from src.neo.core.messages import Message
 
-from src.neo.agent.asm import AgentStateMachine
-from src.neo.agent.state import MAX_TURNS, SUMMARY_RATIO, AgentState
-from src.neo.core.messages import ContentBlock, Message, TextBlock
-from src.neo.session import Session
+# Session is only needed for annotations; importing it here would pull in the
+# whole session/service stack whenever the agent module is loaded
+if TYPE_CHECKING:
+    from src.neo.session import Session
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _base_instructions(workspace: Optional[str]) -> str:
+    """The default instructions template formatted for a workspace."""
+    return load_prompt("neo.txt").format(workspace=workspace)
+
+
+@lru_cache(maxsize=32)
+def _build_instructions(
+    workspace: Optional[str], neorules_path: str, neorules_key: Optional[Tuple[int, int]]
+) -> str:
+    """
+    Build the agent instructions for a workspace, including its .neorules.
+
+    Cached by the modification time and size of the .neorules file
+    (neorules_key, None if there is no such file), so agents created for the
+    same workspace do not read and format the instructions again.
+    """
+    # Kept separately cached, so editing .neorules does not format the template again
+    instructions = _base_instructions(workspace)
+
+    if neorules_key is not None and os.path.isfile(neorules_path):
+        try:
+            # Read the .neorules file
+            with open(neorules_path, "r") as f:
+                neorules_content = f.read().strip()
+
+            # Append the content to the instructions if not empty
+            if neorules_content:
+                instructions = f"{instructions}\n\nCustom rules from .neorules:\n{neorules_content}"
+                logger.info(f"Loaded custom rules from {neorules_path}")
+        except Exception as e:
+            logger.error(f"Error reading .neorules file: {e}")
+
+    return instructions
+
+
 class Agent:
     """
     Agent orchestrates conversations with an LLM and handles command invocations.
@@ -49,36 +91,31 @@ class Agent:
     """
     )
 
+    # Minimum number of seconds between two writes of the state file while
+    # processing a message. The state is always written when processing ends.
+    STATE_FLUSH_INTERVAL = 0.25
+
+    # Number of prompts answered by each request of marshal_process
+    MARSHAL_BATCH_SIZE = 8
+
     def __init__(
         self,
-        session: Session,
+        session: "Session",
         ephemeral: bool = True,
         configuration: Dict[str, str] = None,
     ):
         self.configuration = configuration or {}
 
-        # Read the default instructions template from file
-        template_file = os.path.join(os.path.dirname(__file__), "prompts/neo.txt")
-        with open(template_file, "r") as f:
-            template = f.read()
-
-        # Format the template with the workspace path
-        instructions = template.format(workspace=session._workspace)
-
-        # Check if .neorules exists in the workspace directory
+        # Check if .neorules exists in the workspace directory. Its modification
+        # time and size are part of the cache key, so edits are picked up.
         neorules_path = os.path.join(session.workspace, ".neorules")
-        if os.path.exists(neorules_path) and os.path.isfile(neorules_path):
-            try:
-                # Read the .neorules file
-                with open(neorules_path, "r") as f:
-                    neorules_content = f.read().strip()
-
-                # Append the content to the instructions if not empty
-                if neorules_content:
-                    instructions = f"{instructions}\n\nCustom rules from .neorules:\n{neorules_content}"
-                    logger.info(f"Loaded custom rules from {neorules_path}")
-            except Exception as e:
-                logger.error(f"Error reading .neorules file: {e}")
+        try:
+            neorules_stat = os.stat(neorules_path)
+            neorules_key = (neorules_stat.st_mtime_ns, neorules_stat.st_size)
+        except OSError:
+            neorules_key = None
+
+        instructions = _build_instructions(session._workspace, neorules_path, neorules_key)
 
         self.instructions = instructions
         self.session = session
@@ -88,24 +125,28 @@ class Agent:
             shell=session.shell,
             configuration=self.configuration,
         )
+        # Load the tokenizer and connect to the API while the user types the
+        # first message, instead of during its request
+        session.client.warmup()
 
-        # Ensure session directory exists
+        # Ensure session directory exists. This is the only place it is created;
+        # the state journal writes into it without checking again.
         try:
             session_dir = self.session.internal_session_dir
-            if not os.path.exists(session_dir):
-                os.makedirs(session_dir, exist_ok=True)
-                logger.info(f"Created session directory: {session_dir}")
+            os.makedirs(session_dir, exist_ok=True)
         except Exception as e:
             logger.error(f"Error creating session directory: {e}")
             # If directory creation fails, use a fallback temporary location
             session_dir = os.path.join(os.path.expanduser("~"), ".neo", "temp")
-            if not os.path.exists(session_dir):
-                os.makedirs(session_dir, exist_ok=True)
+            os.makedirs(session_dir, exist_ok=True)
 
         # Path to state file
         self.state_file = os.path.join(session_dir, "agent_state.json")
 
         self.ephemeral = ephemeral
+        # Whether self.state has changes that are not yet in the state file
+        self._dirty = False
+        self._last_flush = 0.0
         # Load state from file or create a fresh state
 
         # Configure command names
@@ -123,21 +164,33 @@ class Agent:
             )
 
         if ephemeral:
+            self._journal = None
             self.state = AgentState(system=instructions)
         else:
-            self.state = AgentState.load(self.state_file, system=instructions)
+            self._journal = StateJournal(self.state_file)
+            self.state = self._journal.load(system=instructions)
 
         # Log agent initialization
         logger.info(
             f"Agent initialized with {len(self._command_names)} available commands: {', '.join(self._command_names)}"
         )
 
-    def process(self, user_message: str) -> Iterator[Message]:
+    def process(
+        self,
+        user_message: str,
+        on_text: Optional[Callable[[str], None]] = None,
+        on_retry: Optional[Callable[[], None]] = None,
+    ) -> Iterator[Message]:
         """
         Process a user message and update the agent's state.
 
         Args:
             user_message: The text message from the user
+            on_text: Optional callback that receives the assistant's text as it
+                is streamed, ahead of the complete messages yielded here
+            on_retry: Optional callback called before a response with invalid
+                command calls is requested again, so its streamed text can be
+                discarded
 
         Returns:
             Iterator of messages from the assistant and command results
@@ -145,30 +198,101 @@ class Agent:
 
         state = self.state
         asm = self.asm
-        state = state.add_messages(Message(role="user", content=user_message))
+        state = state.add_messages(Message.from_text("user", user_message))
 
         logger.info("Processing user message")
 
-        while True:
-            state, output = asm.step(state, self._command_names)
-
-            logger.info(
-                "Agent state:\n\n"
-                + "\n\n".join(
-                    [f"{msg.role}: {msg.model_text()}" for msg in state.messages]
+        try:
+            while True:
+                state, output = asm.step(
+                    state, self._command_names, on_text, on_retry
                 )
-            )
-            state = asm.checkpoint_state(state)
-            state = asm.prune_state(state)
 
-            if not self.ephemeral:
-                state.dump(self.state_file)
+                # Rendering the whole state is O(history), so only do it when it is logged
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Agent state:\n\n%s",
+                        "\n\n".join(
+                            f"{msg.role}: {msg.model_text()}" for msg in state.messages
+                        ),
+                    )
+                state = asm.checkpoint_state(state)
+                state = asm.prune_state(state)
 
-            self.state = state
+                self.state = state
+                self._dirty = True
+                if time.monotonic() - self._last_flush >= self.STATE_FLUSH_INTERVAL:
+                    self._flush_state()
+
+                log_messages = logger.isEnabledFor(logging.INFO)
+                for msg in output.to_messages():
+                    if log_messages:
+                        logger.info("ASSISTANT: %s", msg.model_text())
+                    yield msg
+
+                if output.is_terminal():
+                    break
+        finally:
+            self._flush_state()
+
+    def batch_process(self, user_messages: List[str]) -> List[Message]:
+        """
+        Answer independent user messages with concurrent requests.
+
+        Each message is sent on top of the current conversation, without the
+        others. Neither the messages nor the responses are added to the state,
+        and command calls in the responses are returned without being executed.
+
+        Args:
+            user_messages: The text messages from the user
+
+        Returns:
+            The assistant response to each message, in the same order
+        """
+        history = self.state.to_messages()
+        return self.asm.client.batch_process(
+            [[*history, Message.from_text("user", msg)] for msg in user_messages],
+            commands=self._command_names,
+            session_id=self.asm.session_id,
+        )
+
+    def marshal_process(
+        self,
+        sub_prompts: List[str],
+        schema: Optional[Dict[str, Any]] = None,
+        k: int = MARSHAL_BATCH_SIZE,
+    ) -> List[Any]:
+        """
+        Answer independent prompts k at a time, with one request per group.
+
+        Each group is sent as the numbered rows of a single message and the
+        model answers with a JSON array. The groups are sent concurrently
+        through batch_process, so the state is not changed.
+
+        Args:
+            sub_prompts: The independent prompts
+            schema: Optional JSON schema that each answer must match
+            k: Number of prompts per request
+
+        Returns:
+            The parsed answer to each prompt, in the same order
+
+        Raises:
+            ValueError: If a response is not a JSON array with one answer per prompt
+        """
+        groups = [sub_prompts[i : i + k] for i in range(0, len(sub_prompts), k)]
+        responses = self.batch_process([marshal_rows(group, schema) for group in groups])
 
-            for msg in output.to_messages():
-                logger.info(f"ASSISTANT: {msg.model_text()}")
-                yield msg
+        answers = []
+        for group, response in zip(groups, responses):
+            answers.extend(unmarshal_rows(response.model_text(), len(group)))
+        return answers
 
-            if output.is_terminal():
-                break
+    def _flush_state(self) -> None:
+        """Record unsaved changes to the state in the state journal."""
+        if not self._dirty or self._journal is None:
+            return
+        self._journal.record(self.state)
+        self._journal.flush()
+        self._dirty = False
+        self._last_flush = time.monotonic()
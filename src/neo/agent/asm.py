@@ -6,20 +6,32 @@ Provides a stateless interface for processing agent interactions.
 from abc import ABC, abstractmethod
 import logging
 import os
-from dataclasses import replace
-from textwrap import dedent
-from typing import List, Tuple, Any, Dict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple, Dict
 
 from src.neo.core.messages import Message
-from src.neo.agent.state import AgentState
-from src.neo.shell import Shell
-from src.neo.client import Client
-from src.neo.commands.base import Command
+from src.neo.agent.state import AgentState, approx_tokens
 from src.neo.core.constants import COMMAND_START, STDIN_SEPARATOR
 
+# The client and shell are only needed for annotations; importing them here
+# would load the OpenAI SDK and every command whenever the agent is imported
+if TYPE_CHECKING:
+    from src.neo.client import Client
+    from src.neo.shell import Shell
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+PROMPTS_DIR = os.path.join(os.path.dirname(__file__), "prompts")
+
+
+@lru_cache(maxsize=None)
+def load_prompt(name: str) -> str:
+    """Read a prompt file from the prompts directory. Prompts ship with the
+    package and do not change at runtime, so each file is read only once."""
+    with open(os.path.join(PROMPTS_DIR, name), "r") as f:
+        return f.read()
+
 
 class AgentOutput(ABC):
     @abstractmethod
@@ -61,8 +73,8 @@ class AgentStateMachine:
 
     def __init__(
         self,
-        client: Client,
-        shell: Shell,
+        client: "Client",
+        shell: "Shell",
         session_id: str,
         configuration: Dict[str, str],
     ):
@@ -83,8 +95,24 @@ class AgentStateMachine:
             configuration.get("head_truncation.retention", "70")
         )
 
+        # Estimated number of tokens at which the head of the conversation is
+        # truncated regardless of the number of messages. Leaves headroom below
+        # the context window for the response.
+        self.head_truncation_trigger_tokens = int(
+            configuration.get("head_truncation.trigger_tokens", "150000")
+        )
+
+        # Estimated number of tokens to keep after truncation triggered by tokens.
+        self.head_truncation_retention_tokens = int(
+            configuration.get("head_truncation.retention_tokens", "100000")
+        )
+
     def step(
-        self, state: AgentState, commands: List[str]
+        self,
+        state: AgentState,
+        commands: Sequence[str],
+        on_text: Optional[Callable[[str], None]] = None,
+        on_retry: Optional[Callable[[], None]] = None,
     ) -> Tuple[AgentState, AgentOutput]:
 
         # Add a "continue" message if the last message is not from the user
@@ -93,7 +121,11 @@ class AgentStateMachine:
 
         # Call the client to get a response
         assistant_response = self.client.process(
-            messages=state.to_messages(), commands=commands, session_id=self.session_id
+            messages=state.to_messages(),
+            commands=commands,
+            session_id=self.session_id,
+            on_text=on_text,
+            on_retry=on_retry,
         )
 
         if assistant_response.has_command_executions():
@@ -116,11 +148,14 @@ class AgentStateMachine:
         """
         Returns a new AgentState with the checkpoint added.
         """
-        # Check number of messages since the last checkpoint
+        # Check number of messages since the last checkpoint. Scan from the end,
+        # since only the latest checkpoint matters and it is usually recent.
+        messages = state.messages
         last_checkpoint_index = -1
-        for i, msg in enumerate(state.messages):
-            if msg.metadata.get("is_checkpoint") == "true":
+        for i in range(len(messages) - 1, -1, -1):
+            if messages[i].metadata.get("is_checkpoint") == "true":
                 last_checkpoint_index = i
+                break
 
         num_messages_since_checkpoint = len(state.messages) - last_checkpoint_index + 1
         if num_messages_since_checkpoint < self.checkpoint_interval:
@@ -128,12 +163,7 @@ class AgentStateMachine:
 
         logger.info(f"Checkpointing after {num_messages_since_checkpoint} messages")
 
-        # Read checkpoint instructions from file
-        checkpoint_file = os.path.join(
-            os.path.dirname(__file__), "prompts/checkpoint.md"
-        )
-        with open(checkpoint_file, "r") as f:
-            checkpoint_instructions = f.read()
+        checkpoint_instructions = load_prompt("checkpoint.md")
 
         num_attempts = 0
 
@@ -183,18 +213,41 @@ class AgentStateMachine:
         """
         Returns a new AgentState with the state pruned if necessary.
 
-        This method checks if the conversation has grown too large and,
-        if it has, truncates older messages while keeping the most recent ones.
+        This method checks if the conversation has grown too large, either in
+        number of messages or in estimated tokens, and if it has, truncates
+        older messages while keeping the most recent ones.
         """
         # Count the number of messages (except system message)
         message_count = len(state.messages)
+        over_token_budget = state.approx_tokens() > self.head_truncation_trigger_tokens
 
-        # If below threshold, no pruning needed
-        if message_count <= self.head_truncation_trigger_threshold:
+        # If below thresholds, no pruning needed
+        if message_count <= self.head_truncation_trigger_threshold and not over_token_budget:
             return state
 
-        # Find the latest checkpoint that has at least head_truncation_retention messages after it
-        checkpoint_index = -1
+        if over_token_budget:
+            checkpoint_index = self._budgeted_checkpoint_index(state)
+        else:
+            checkpoint_index = self._retained_checkpoint_index(state)
+
+        # If no valid checkpoint found, return original state
+        if checkpoint_index == -1:
+            return state
+
+        # Drop messages before the checkpoint
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Pruning state with the following checkpoint: %s%s",
+                state.messages[checkpoint_index].model_text(),
+                state.messages[checkpoint_index + 1].model_text(),
+            )
+        return state.drop(checkpoint_index)
+
+    def _retained_checkpoint_index(self, state: AgentState) -> int:
+        """
+        Index of the latest checkpoint that has at least head_truncation_retention
+        messages after it, or -1 if there is none.
+        """
         for i, msg in enumerate(reversed(state.messages)):
             num_messages_after = i
             if msg.metadata.get("is_checkpoint") != "true":
@@ -204,17 +257,23 @@ class AgentStateMachine:
             num_messages_after_checkpoint = num_messages_after - 2
             if num_messages_after_checkpoint < self.head_truncation_retention:
                 continue
-            checkpoint_index = len(state.messages) - i - 1
-            break
+            return len(state.messages) - i - 1
+        return -1
 
-        # If no valid checkpoint found, return original state
-        if checkpoint_index == -1:
-            return state
-
-        # Drop messages before the checkpoint
-        logger.info(
-            f"Pruning state with the following checkpoint: "
-            + f"{state.messages[checkpoint_index].model_text()}"
-            + f"{state.messages[checkpoint_index + 1].model_text()}"
-        )
-        return state.drop(checkpoint_index)
+    def _budgeted_checkpoint_index(self, state: AgentState) -> int:
+        """
+        Index of the oldest checkpoint whose messages from the checkpoint on fit
+        in head_truncation_retention_tokens, so as much recent context as the
+        budget allows is kept. Falls back to the latest checkpoint if even that
+        does not fit, and returns -1 if there is no checkpoint to truncate at.
+        """
+        messages = state.messages
+        checkpoint_index = -1
+        retained_tokens = 0
+        for i in range(len(messages) - 1, 0, -1):
+            retained_tokens += approx_tokens(messages[i])
+            if retained_tokens > self.head_truncation_retention_tokens and checkpoint_index != -1:
+                break
+            if messages[i].metadata.get("is_checkpoint") == "true":
+                checkpoint_index = i
+        return checkpoint_index
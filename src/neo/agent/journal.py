@@ -0,0 +1,197 @@
+"""Append-only persistence for the agent state.
+
+Rewriting the whole conversation after every step writes O(N) bytes per step.
+Instead, the journal records each change to the message list as one JSON line
+in ``agent_state.jsonl`` next to a snapshot in ``agent_state.json``. Loading
+replays the journal on top of the snapshot, and the snapshot is rewritten
+(compacted) only once the journal grows long relative to the state, which
+happens after older messages have been dropped.
+
+Dropped messages are not lost: they are appended to ``agent_archive.jsonl``,
+where the ``recall_archive`` command can search them.
+"""
+
+import logging
+import os
+from typing import List, Optional
+
+from src.neo.agent.state import AgentState, write_json_atomic
+from src.neo.core.messages import Message
+from src.utils import serialization
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Messages dropped from the state, one JSON object per line, oldest first
+ARCHIVE_FILE_NAME = "agent_archive.jsonl"
+
+
+class StateJournal:
+    """
+    Persists an AgentState as a snapshot file plus a journal of changes.
+    Both files live in the directory of the snapshot, which must exist.
+
+    Every journal entry carries the generation of the snapshot it applies to.
+    Compaction writes a snapshot with a new generation before truncating the
+    journal, so entries left behind by an interrupted compaction are ignored.
+    """
+
+    # Compact once the journal has this many times more entries than the state has messages
+    COMPACTION_RATIO = 2
+
+    # Entries are appended with a single os.write per flush on a raw descriptor
+    OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+
+    def __init__(self, snapshot_path: str):
+        self.snapshot_path = snapshot_path
+        self.journal_path = os.path.splitext(snapshot_path)[0] + ".jsonl"
+        self.archive_path = os.path.join(os.path.dirname(snapshot_path), ARCHIVE_FILE_NAME)
+        self._generation = 0
+        self._num_entries = 0
+        self._fd: Optional[int] = None
+        # Encoded entries not yet written to the journal file
+        self._pending: List[bytes] = []
+        # Messages of the last recorded state, used to compute the next change
+        self._messages: Optional[List[Message]] = None
+
+    def load(self, system: str) -> AgentState:
+        """Load the persisted state, replaying the journal on top of the snapshot."""
+        messages: List[Message] = []
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "rb") as f:
+                state_data = serialization.loads(f.read())
+            assert "messages" in state_data, "State data must have 'messages' key"
+            assert "system" in state_data, "State data must have 'system' key"
+
+            messages = [Message.from_dict(msg) for msg in state_data["messages"]]
+            self._generation = state_data.get("generation", 0)
+
+            if system != state_data["system"]:
+                logger.info("System message does not match the persisted system message")
+
+        num_entries = 0
+        corrupt = False
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, "rb") as f:
+                for line in f:
+                    try:
+                        entry = serialization.loads(line)
+                    except ValueError:
+                        # A partially written last line from an interrupted flush
+                        logger.warning("Ignoring malformed entry in %s", self.journal_path)
+                        corrupt = True
+                        break
+                    if entry.get("gen") != self._generation:
+                        continue
+                    if entry["op"] == "append":
+                        messages.append(Message.from_dict(entry["msg"]))
+                    elif entry["op"] == "drop":
+                        del messages[: entry["count"]]
+                    num_entries += 1
+
+        state = AgentState(system=system, messages=messages)
+        self._num_entries = num_entries
+        # Appending after a malformed line would corrupt the next entry, so a
+        # damaged journal is replaced by a fresh snapshot on the next record
+        self._messages = None if corrupt else state.messages
+        return state
+
+    def record(self, state: AgentState) -> None:
+        """
+        Record the changes from the last recorded state to this one.
+
+        States are derived from each other by dropping messages from the head
+        and appending messages to the tail, which is what the journal records.
+        Any other change is persisted by compacting.
+        """
+        previous = self._messages
+        messages = state.messages
+        if previous is None:
+            self.compact(state)
+            return
+
+        # Number of messages dropped from the head of the previous state. Messages
+        # are shared between derived states, so identity tells where they line up.
+        dropped = 0
+        if previous and messages:
+            first = messages[0]
+            for i, msg in enumerate(previous):
+                if msg is first:
+                    dropped = i
+                    break
+            else:
+                dropped = len(previous)
+        else:
+            dropped = len(previous)
+
+        kept = len(previous) - dropped
+        if kept > len(messages) or (kept > 0 and messages[kept - 1] is not previous[-1]):
+            self.compact(state)
+            return
+
+        if dropped:
+            self._archive(previous[:dropped])
+            self._write({"op": "drop", "count": dropped})
+        for msg in messages[kept:]:
+            self._write({"op": "append", "msg": msg.to_dict()})
+        self._messages = messages
+
+        if self._num_entries > self.COMPACTION_RATIO * max(len(messages), 1):
+            self.compact(state)
+
+    def compact(self, state: AgentState) -> None:
+        """Write a snapshot of the state and start a new, empty journal."""
+        self._generation += 1
+        write_json_atomic(
+            self.snapshot_path, {**state.to_dict(), "generation": self._generation}
+        )
+
+        # Pending entries are part of the snapshot
+        self._pending.clear()
+        self._close_fd()
+        self._fd = os.open(self.journal_path, self.OPEN_FLAGS | os.O_TRUNC, 0o644)
+        self._num_entries = 0
+        self._messages = state.messages
+
+    def flush(self) -> None:
+        """
+        Write journal entries recorded since the last flush to the journal file.
+
+        The entries are appended without fsync, since flush runs periodically
+        while the agent works; close syncs them to disk.
+        """
+        if not self._pending:
+            return
+        if self._fd is None:
+            self._fd = os.open(self.journal_path, self.OPEN_FLAGS, 0o644)
+
+        data = memoryview(b"".join(self._pending))
+        self._pending.clear()
+        while data:
+            data = data[os.write(self._fd, data):]
+
+    def close(self) -> None:
+        """Flush, sync and close the journal file."""
+        self.flush()
+        if self._fd is not None:
+            os.fsync(self._fd)
+        self._close_fd()
+
+    def _archive(self, messages: List[Message]) -> None:
+        """Append messages dropped from the state to the archive."""
+        with open(self.archive_path, "ab") as f:
+            f.write(b"".join(serialization.dumps(msg.to_dict()) + b"\n" for msg in messages))
+
+    def __del__(self) -> None:
+        # Raw descriptors are not closed by the garbage collector
+        self._close_fd()
+
+    def _close_fd(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _write(self, entry: dict) -> None:
+        entry["gen"] = self._generation
+        self._pending.append(serialization.dumps(entry) + b"\n")
+        self._num_entries += 1
@@ -0,0 +1,52 @@
+"""Row marshaling of independent prompts.
+
+Several independent prompts are sent to the model as the numbered rows of a
+single message, and the model answers with a JSON array holding one answer
+per row. This trades one request per prompt for one request per group.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+# Matches a JSON array wrapped in a markdown code fence
+_FENCED_JSON = re.compile(r"```(?:json)?\s*(\[.*\])\s*```", re.DOTALL)
+
+
+def marshal_rows(prompts: List[str], schema: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a message asking for the answers to prompts as one JSON array.
+
+    Args:
+        prompts: The independent prompts, one per row
+        schema: Optional JSON schema that each answer must match
+    """
+    lines = [
+        f"Answer each of the following {len(prompts)} independent requests "
+        "separately. Reply with only a JSON array holding exactly one answer "
+        "per request, in the same order as the requests.",
+    ]
+    if schema is not None:
+        lines.append(f"Each answer must match this JSON schema: {json.dumps(schema)}")
+    lines.append("")
+    lines.extend(f"{i}. {prompt}" for i, prompt in enumerate(prompts, start=1))
+    return "\n".join(lines)
+
+
+def unmarshal_rows(text: str, count: int) -> List[Any]:
+    """
+    Parse the JSON array of answers from a response to marshal_rows.
+
+    Raises:
+        ValueError: If the response is not a JSON array of count answers
+    """
+    match = _FENCED_JSON.search(text)
+    if match:
+        text = match.group(1)
+
+    answers = json.loads(text)
+    if not isinstance(answers, list):
+        raise ValueError(f"Expected a JSON array of answers, got: {text[:100]}")
+    if len(answers) != count:
+        raise ValueError(f"Expected {count} answers, got {len(answers)}")
+    return answers
@@ -4,48 +4,85 @@ Handles the conversation state, including message storage, serialization, and ch
 """
 
 from dataclasses import dataclass, field, replace
-import json
 import logging
 import os
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from src.neo.core.messages import Message
+from src.utils import serialization
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Configuration constants for message summarization
-MAX_TURNS = 100           # Number of turns before triggering summarization
-SUMMARY_RATIO = 0.2       # Percentage of older turns to summarize
+# Approximate number of characters per token, for estimating prompt sizes
+CHARS_PER_TOKEN = 4
+
+
+def approx_tokens(message: Message) -> int:
+    """Estimate the number of tokens a message takes up in a request."""
+    return len(message.model_text()) // CHARS_PER_TOKEN + 4  # Add formatting tokens
+
+
+def write_json_atomic(filepath: str, data: Dict[str, Any]) -> None:
+    """
+    Write data to a file as compact JSON.
+
+    The data is written to a temporary file which then replaces the existing
+    one, so a crash mid-write never leaves a truncated file behind. The
+    directory of filepath must already exist.
+    """
+    tmp_filepath = filepath + ".tmp"
+    with open(tmp_filepath, "wb", buffering=1 << 16) as f:
+        f.write(serialization.dumps(data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_filepath, filepath)
 
 
 @dataclass
 class AgentState:
     system: str
     messages: List[Message] = field(default_factory=list)
+    # System message built once from `system` and carried across `replace` calls
+    _system_message: Optional[Message] = field(default=None, repr=False, compare=False)
+    # Estimated tokens of the system message and messages, kept up to date as
+    # messages are added and dropped; None until first needed
+    _approx_tokens: Optional[int] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self._system_message is None or self._system_message.content[0].model_text() is not self.system:
+            self._system_message = Message.from_text("system", self.system)
     
     def add_messages(self, *messages: Message) -> "AgentState":
         """Add messages to the state and return a new AgentState."""
-        new_messages = self.messages.copy()
-        new_messages.extend(messages)
-        return replace(self, messages=new_messages)
+        num_tokens = self._approx_tokens
+        if num_tokens is not None:
+            num_tokens += sum(approx_tokens(msg) for msg in messages)
+        return replace(self, messages=[*self.messages, *messages], _approx_tokens=num_tokens)
     
     def clear_messages(self) -> "AgentState":
-        return replace(self, messages=[])
+        return replace(self, messages=[], _approx_tokens=None)
     
     def drop(self, num_messages: int) -> "AgentState":
         """Drop the specified number of messages from the state and return a new AgentState."""
         if num_messages == 0:
             return self
         
+        num_tokens = self._approx_tokens
+        if num_tokens is not None:
+            num_tokens -= sum(approx_tokens(msg) for msg in self.messages[:num_messages])
         new_messages = self.messages[num_messages:]
-        return replace(self, messages=new_messages)
+        return replace(self, messages=new_messages, _approx_tokens=num_tokens)
+
+    def approx_tokens(self) -> int:
+        """Estimate the number of tokens the state takes up in a request."""
+        if self._approx_tokens is None:
+            self._approx_tokens = sum(approx_tokens(msg) for msg in self.to_messages())
+        return self._approx_tokens
     
     def to_messages(self) -> List[Message]:
         """Get the full list of messages including system message."""
-        return [
-            Message("system", self.system)
-        ] + self.messages
+        return [self._system_message, *self.messages]
     
     def slice_turns(self, start: Optional[int], end: Optional[int]) -> "AgentState":
         """Get a copy of the state with message pairs (turns) sliced from start to end.
@@ -64,7 +101,7 @@ class AgentState:
         msg_end = None if end is None else end * 2
         
         sliced_messages = self.messages[msg_start:msg_end]
-        return replace(self, messages=sliced_messages)
+        return replace(self, messages=sliced_messages, _approx_tokens=None)
 
     @classmethod
     def load(cls, filepath: str, system: str) -> "AgentState":
@@ -73,8 +110,8 @@ class AgentState:
         if not os.path.exists(filepath):
             return cls(system=system, messages=[])
 
-        with open(filepath, "r") as f:
-            state_data = json.load(f)
+        with open(filepath, "rb") as f:
+            state_data = serialization.loads(f.read())
             assert "messages" in state_data, "State data must have 'messages' key"
             assert "system" in state_data, "State data must have 'system' key"
 
@@ -87,20 +124,18 @@ class AgentState:
 
             return cls(system=system, messages=persisted_messages)
     
-    def dump(self, filepath: str) -> None:
-        """Save agent state to a file."""
-        # Convert state to dictionary
-        state_data = {
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the state to a dictionary for serialization."""
+        return {
             "system": self.system,
             "messages": [msg.to_dict() for msg in self.messages]
         }
 
+    def dump(self, filepath: str) -> None:
+        """Save agent state to a file."""
         # Ensure directory exists
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-        # Write to file (with pretty printing for readability)
-        with open(filepath, "w") as f:
-            json.dump(state_data, f, indent=2)
+        write_json_atomic(filepath, self.to_dict())
 
     def is_terminal(self) -> bool:
         if len(self.messages) == 0:
@@ -3,11 +3,14 @@ Client module provides abstraction over LLM clients using the OpenAI API format.
 Handles client instantiation and request/response logging.
 """
 
+import hashlib
 import logging
-from typing import List, Optional, Dict, Any, Union
-
-from openai._utils import transform
-from openai.types import Completion
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Dict, Any, Sequence, Union
 
 from src.neo.client.proxy import Proxy
 from src.neo.core.constants import (
@@ -18,10 +21,17 @@ from src.neo.core.constants import (
 )
 from src.neo.core.messages import CommandCall, Message, TextBlock
 from src.neo.shell import Shell
+from src.utils import serialization
+from src.utils.cache import IdentityLRUCache
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Zero-width positions where a response is split into text and command segments
+_COMMAND_BOUNDARY = re.compile(
+    f"(?={re.escape(COMMAND_START)})|(?<={re.escape(COMMAND_END)})"
+)
+
 
 class Client:
     """
@@ -29,48 +39,149 @@ class Client:
     Handles client instantiation, request/response logging, and command parsing.
     """
 
-    # Instructions for command execution format
-
-    def __init__(self, shell: Shell):
+    # Maximum number of requests made while asking the model to correct invalid commands
+    MAX_REQUESTS = 4
+
+    # Number of preprocessed messages kept for reuse across requests. This should
+    # comfortably exceed the number of messages the agent keeps in its state.
+    PREPROCESSED_CACHE_SIZE = 256
+
+    # Number of messages that may follow the latest prompt cache anchor before
+    # the anchor is moved forward. Anchors stay put in between so that the
+    # provider keeps serving the cached prefix instead of rewriting it.
+    CACHE_ANCHOR_BUFFER = 16
+
+    # Maximum number of requests from one batch_process call in flight at once
+    BATCH_MAX_WORKERS = 8
+
+    def __init__(self, shell: Shell, response_cache_size: Optional[int] = None):
+        """
+        Args:
+            shell: Shell used to validate and parse command calls
+            response_cache_size: Number of responses kept for identical requests.
+                Defaults to the NEO_RESPONSE_CACHE_SIZE environment variable, or 0
+                (disabled) since sampled responses are not generally reusable.
+        """
         self._client = Proxy.get_proxy()
         self._shell = shell
+        if response_cache_size is None:
+            response_cache_size = int(os.environ.get("NEO_RESPONSE_CACHE_SIZE", "0"))
+        self._response_cache_size = response_cache_size
+        self._responses: "OrderedDict[bytes, Message]" = OrderedDict()
+        self._responses_lock = threading.Lock()
+        self._preprocessed: IdentityLRUCache[Message] = IdentityLRUCache(
+            self.PREPROCESSED_CACHE_SIZE
+        )
+        # Indices of the current and previous prompt cache anchors
+        self._cache_anchors: List[int] = []
+        # Messages marked with cache-control by the previous request
+        self._cache_marked: List[Message] = []
+        self._warmup_started = False
+
+    def warmup(self) -> None:
+        """
+        Prepare the proxy for the first request on a background thread.
+        Only the first call starts the thread.
+        """
+        if self._warmup_started:
+            return
+        self._warmup_started = True
+        threading.Thread(
+            target=self._client.warmup, name="ClientWarmup", daemon=True
+        ).start()
 
     def process(
         self,
         messages: List[Message],
-        commands: List[str] = None,
+        commands: Sequence[str] = None,
         model: Optional[str] = None,
         output_schema: Union[str, Dict[str, Any]] = None,
         session_id: Optional[str] = None,
+        on_text: Optional[Callable[[str], None]] = None,
+        on_retry: Optional[Callable[[], None]] = None,
     ) -> Message:
-        messages_to_send = messages.copy()
-
-        for message in messages_to_send:
-            message.metadata["cache-control"] = False
-
-        messages_to_send[-1].metadata["cache-control"] = True
-        if len(messages_to_send) >= 3:
-            messages_to_send[-3].metadata["cache-control"] = True
+        self._mark_cache_anchors(messages)
+        return self._process_with_corrections(
+            messages, commands, model, output_schema, session_id, on_text, on_retry
+        )
 
-        num_requests = 0
+    def batch_process(
+        self,
+        messages_batch: List[List[Message]],
+        commands: Sequence[str] = None,
+        model: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> List[Message]:
+        """
+        Process independent conversations concurrently.
+
+        The requests are in flight together, so the provider can batch them,
+        instead of each waiting for the previous response. Responses are
+        returned in the order of messages_batch.
+
+        Cache-control markers are left as they are, since the conversations
+        usually share their history and would move each other's anchors.
+        """
+        if not messages_batch:
+            return []
+
+        num_workers = min(len(messages_batch), self.BATCH_MAX_WORKERS)
+        with ThreadPoolExecutor(
+            max_workers=num_workers, thread_name_prefix="ClientBatch"
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._process_with_corrections,
+                    messages=messages,
+                    commands=commands,
+                    model=model,
+                    output_schema=None,
+                    session_id=session_id,
+                    on_text=None,
+                    on_retry=None,
+                )
+                for messages in messages_batch
+            ]
+            return [future.result() for future in futures]
 
-        while True:
-            response = self._process(
+    def _process_with_corrections(
+        self,
+        messages: List[Message],
+        commands: Optional[Sequence[str]],
+        model: Optional[str],
+        output_schema: Union[str, Dict[str, Any], None],
+        session_id: Optional[str],
+        on_text: Optional[Callable[[str], None]],
+        on_retry: Optional[Callable[[], None]],
+    ) -> Message:
+        """
+        Request a response, asking the model to correct invalid command calls.
+
+        Every attempt streams its text to on_text. on_retry is called before a
+        rejected response is requested again, so the text streamed for it can
+        be discarded.
+        """
+        # The list itself is never mutated, so it is sent as is rather than copied
+        messages_to_send = messages
+
+        max_requests = self.MAX_REQUESTS
+        process = self._process
+        validate_command_calls = self._shell.validate_command_calls
+
+        for num_requests in range(1, max_requests + 1):
+            response = process(
                 messages=messages_to_send,
                 commands=commands,
                 model=model,
                 session_id=session_id,
+                on_text=on_text,
             )
-            num_requests += 1
 
-            if not response.has_command_executions():
-                return response
-
-            if num_requests > 3:
+            if num_requests == max_requests or not response.has_command_executions():
                 return response
 
             command_calls = response.get_command_calls()
-            validation_results = self._shell.validate_command_calls(
+            validation_results = validate_command_calls(
                 command_calls, output_schema
             )
             validation_failures = [
@@ -98,13 +209,43 @@ class Client:
             if num_valid_commands > 0:
                 correction_message += f"\n{num_valid_commands} were valid but have not been executed. Send them again too."
 
-            messages_to_send = messages.copy() + [
-                response,
-                Message(
-                    role="user",
-                    content=[*validation_failures, TextBlock(correction_message)],
-                ),
-            ]
+            # Each retry resends the history with only the latest response and
+            # its correction, so the history is copied once and the two trailing
+            # entries are replaced in place on later retries
+            if messages_to_send is messages:
+                messages_to_send = [*messages, None, None]
+            messages_to_send[-2] = response
+            messages_to_send[-1] = Message(
+                role="user",
+                content=[*validation_failures, TextBlock(correction_message)],
+            )
+            if on_retry is not None:
+                on_retry()
+
+    def _mark_cache_anchors(self, messages: List[Message]) -> None:
+        """
+        Set cache-control on the system message and the prompt cache anchors.
+
+        The latest anchor only moves to the end of the conversation once more
+        than CACHE_ANCHOR_BUFFER messages follow it. The previous anchor stays
+        marked as well, so the request that moves the anchor still reads the
+        prefix cached up to the previous one.
+        """
+        # Persisted messages may still carry markers from an earlier run, so
+        # clear every message the first time and only the marked ones after that
+        for message in self._cache_marked if self._cache_anchors else messages:
+            message.metadata["cache-control"] = False
+
+        last = len(messages) - 1
+        anchors = [index for index in self._cache_anchors if index <= last]
+        if not anchors or last - anchors[-1] > self.CACHE_ANCHOR_BUFFER:
+            anchors.append(last)
+        self._cache_anchors = anchors[-2:]
+
+        marked = [messages[0], *(messages[index] for index in self._cache_anchors)]
+        for message in marked:
+            message.metadata["cache-control"] = True
+        self._cache_marked = marked
 
     def _get_assistant_prefill(self, messages: List[Message]) -> Optional[str]:
         """Extract assistant_prefill from the last user message if present."""
@@ -119,37 +260,86 @@ class Client:
     def _process(
         self,
         messages: List[Message],
-        commands: List[str] = None,
+        commands: Sequence[str] = None,
         model: Optional[str] = None,
         session_id: Optional[str] = None,
+        on_text: Optional[Callable[[str], None]] = None,
     ) -> Message:
         processed_messages = self._preprocess_messages(messages, commands)
+
+        cache_key = None
+        if self._response_cache_size > 0:
+            cache_key = self._response_cache_key(processed_messages, commands, model)
+            with self._responses_lock:
+                cached = self._responses.get(cache_key)
+                if cached is not None:
+                    self._responses.move_to_end(cache_key)
+            if cached is not None:
+                logger.info("Reusing cached response for an identical request")
+                return cached.copy()
+
         response = self._client.process(
             messages=processed_messages,
             model=model,
             stop=[SUCCESS_PREFIX, ERROR_PREFIX],
             session_id=session_id,
+            on_text=on_text,
         )
-        return self._postprocess_response(response, messages)
+        response = self._postprocess_response(response, messages)
+
+        # Error replies from the proxy carry no metadata and are never cached
+        if cache_key is not None and response.metadata:
+            with self._responses_lock:
+                self._responses[cache_key] = response.copy()
+                if len(self._responses) > self._response_cache_size:
+                    self._responses.popitem(last=False)
+        return response
+
+    def _response_cache_key(
+        self, messages: List[Message], commands: Sequence[str], model: Optional[str]
+    ) -> bytes:
+        """Hash everything that determines the request sent to the model."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(serialization.dumps([model, commands]))
+        for message in messages:
+            digest.update(serialization.dumps([message.role, message.model_text()]))
+        return digest.digest()
 
     def _preprocess_messages(
-        self, messages: List[Message], commands: List[str]
+        self, messages: List[Message], commands: Sequence[str]
     ) -> List[Message]:
-        processed_messages = []
-
         assert messages[0].role == "system", "System message must be first"
-        processed_messages.append(
-            Message(
+        processed_messages = [
+            self._preprocess_message(message, is_system=(i == 0))
+            for i, message in enumerate(messages)
+        ]
+
+        assistant_prefill = self._get_assistant_prefill(processed_messages)
+        if assistant_prefill:
+            processed_messages.append(Message.from_text("assistant", assistant_prefill))
+
+        return processed_messages
+
+    def _preprocess_message(self, message: Message, is_system: bool) -> Message:
+        """
+        Convert a message to the roles and plain text blocks sent to the model.
+
+        Conversation history is resent on every request, so converted messages are
+        cached and reused. The converted message shares the metadata dict of the
+        original, so cache-control markers set on the original still apply.
+        """
+        cached = self._preprocessed.get(message)
+        if cached is not None:
+            return cached
+
+        if is_system:
+            processed = Message(
                 role="system",
-                content=[
-                    *messages[0].content,
-                ],
-                metadata=messages[0].metadata,
+                content=[*message.content],
+                metadata=message.metadata,
             )
-        )
-
-        # Convert all message blocks to TextBlock
-        for message in messages[1:]:
+        else:
+            # Convert all message blocks to TextBlock
             if message.role == "developer":
                 prefix = "<SYSTEM>"
                 suffix = "</SYSTEM>"
@@ -159,36 +349,22 @@ class Client:
                 suffix = ""
                 role = message.role
 
-            processed_messages.append(
-                Message(
-                    role=role,
-                    content=[
-                        TextBlock(text=prefix + block.model_text() + suffix)
-                        for block in message.content
-                    ],
-                    metadata=message.metadata,
-                    assistant_prefill=message.assistant_prefill,
-                )
-            )
-
-        assistant_prefill = self._get_assistant_prefill(processed_messages)
-        if assistant_prefill:
-            processed_messages.append(
-                Message(
-                    role="assistant",
-                    content=assistant_prefill,
-                )
+            processed = Message(
+                role=role,
+                content=[
+                    TextBlock(text=prefix + block.model_text() + suffix)
+                    for block in message.content
+                ],
+                metadata=message.metadata,
+                assistant_prefill=message.assistant_prefill,
             )
 
-        return processed_messages
+        self._preprocessed.put(message, processed)
+        return processed
 
     def _postprocess_response(
         self, response: Message, messages: List[Message]
     ) -> Message:
-        # Verify command markers are single characters for optimization
-        assert len(COMMAND_START) == 1, "COMMAND_START must be a single character"
-        assert len(COMMAND_END) == 1, "COMMAND_END must be a single character"
-
         # Get assistant_prefill from the last user message if present
         assistant_prefill = self._get_assistant_prefill(messages)
 
@@ -215,29 +391,14 @@ class Client:
         # Update response with processed content
         response.content = processed_content
 
-        blocks = []
-        for block in response.content:
-            curr_block_buffer = []
-            prev_char = None
-            for char in block.model_text():
-                if char == COMMAND_START or prev_char == COMMAND_END:
-                    blocks.append("".join(curr_block_buffer))
-                    curr_block_buffer = []
-
-                curr_block_buffer.append(char)
-                prev_char = char
-
-            blocks.append("".join(curr_block_buffer))
-
-        parsed_blocks = []
-        for block in blocks:
-            # Skip empty blocks
-            if not block.strip():
-                continue
-            if block.startswith(COMMAND_START):
-                parsed_blocks.append(CommandCall(block))
-            else:
-                parsed_blocks.append(TextBlock(block))
+        # A new segment starts at every COMMAND_START and right after every COMMAND_END
+        parsed_blocks = [
+            CommandCall(segment) if segment.startswith(COMMAND_START) else TextBlock(segment)
+            for block in response.content
+            for segment in _COMMAND_BOUNDARY.split(block.model_text())
+            # Skip empty segments
+            if segment and not segment.isspace()
+        ]
 
         return Message(
             role="assistant", metadata=response.metadata, content=parsed_blocks
@@ -3,35 +3,45 @@ OpenRouter proxy implementation for LLM client.
 Handles communication with OpenRouter's API using the OpenAI API format.
 """
 
-from collections import deque
+from functools import lru_cache
 import os
 import logging
 import datetime
 import requests
 import time
 from pathlib import Path
-from typing import Iterable, List, Dict, Any, Optional, Tuple, Union
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
 import tiktoken
 
+import httpx
 import openai
 
 from src.logging.structured_logger import StructuredLogger
 from src.neo.core.constants import COMMAND_START, COMMAND_END
 from src.neo.core.messages import TextBlock, Message
 from src.neo.client.proxy import Proxy
-from openai.types import Completion
+from src.utils.cache import IdentityLRUCache
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_encoding() -> "tiktoken.Encoding":
+    """The tokenizer used to estimate request sizes."""
+    return tiktoken.encoding_for_model("gpt-4")
+
+
 class OpenRouterProxy(Proxy):
     """
     OpenRouter implementation of the Proxy interface.
     Handles client instantiation, request/response logging, and response parsing.
     """
 
+    # Number of message payloads kept for reuse across requests
+    PAYLOAD_CACHE_SIZE = 256
+
     def __init__(self):
         """
         Initialize the OpenRouter client using environment variables.
@@ -57,6 +67,18 @@ class OpenRouterProxy(Proxy):
         # Initialize structured logger
         self._logger = StructuredLogger()
 
+        # Request payloads of each message already sent, without and with the
+        # cache-control marker. The conversation history is resent unchanged on
+        # every request, so each message is rendered and wrapped once.
+        self._payloads: IdentityLRUCache[Tuple[Dict[str, Any], Dict[str, Any]]] = (
+            IdentityLRUCache(self.PAYLOAD_CACHE_SIZE)
+        )
+        # Token counts of the payload texts, keyed by the same string objects, so
+        # the system prompt and history are tokenized once rather than per request
+        self._token_counts: IdentityLRUCache[int] = IdentityLRUCache(
+            self.PAYLOAD_CACHE_SIZE
+        )
+
     def _build_request(
         self,
         messages: List[Message],
@@ -78,16 +100,30 @@ class OpenRouterProxy(Proxy):
 
         # Process all messages
         for message in messages:
-            additional_params = {}
-            if message.metadata.get("cache-control", False):
-                additional_params["cache_control"] = {"type": "ephemeral"}
+            payloads = self._payloads.get(message)
+            if payloads is None:
+                text = message.model_text()
+                payloads = (
+                    {
+                        "role": message.role,
+                        "content": [{"type": "text", "text": text}],
+                    },
+                    {
+                        "role": message.role,
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": text,
+                                "cache_control": {"type": "ephemeral"},
+                            }
+                        ],
+                    },
+                )
+                self._payloads.put(message, payloads)
+
+            # Markers move between requests, so the variant is picked each time
             processed_messages.append(
-                {
-                    "role": message.role,
-                    "content": [
-                        {"type": "text", "text": message.model_text(), **additional_params}
-                    ],
-                }
+                payloads[1] if message.metadata.get("cache-control", False) else payloads[0]
             )
 
         # Prepare request data
@@ -108,6 +144,7 @@ class OpenRouterProxy(Proxy):
         model: Optional[str] = None,
         stop: List[str] = None,
         session_id: Optional[str] = None,
+        on_text: Optional[Callable[[str], None]] = None,
     ) -> Message:
         """
         Process a conversation with the LLM and return the response.
@@ -117,12 +154,14 @@ class OpenRouterProxy(Proxy):
             model: Optional model identifier to override the default model
             stop: Optional list of stop sequences
             session_id: Optional session identifier for tracking
+            on_text: Optional callback that receives the response text as it is
+                streamed. The returned message remains the complete response.
 
         Returns:
             Message: LLM's response as a Message object
 
         Raises:
-            Exception: Any error during processing is logged and re-raised
+            Exception: Any error other than an API or network failure is re-raised
         """
         try:
             # Use the provided model or fall back to default model
@@ -130,6 +169,9 @@ class OpenRouterProxy(Proxy):
 
             # Build the request data
             request_data = self._build_request(messages, model_id, stop)
+            if on_text is not None:
+                request_data["stream"] = True
+                request_data["stream_options"] = {"include_usage": True}
 
             # Add debugging information
             logger.debug(
@@ -145,19 +187,32 @@ class OpenRouterProxy(Proxy):
             response = self._send_request(request_data, session_id or "default")
 
             # Parse and return the response
+            if on_text is not None:
+                return self._parse_stream(response, request_data, on_text)
             return self._parse_response(messages, response, request_data)
 
-        except Exception as e:
-            logger.exception(f"Error in LLM client: {e}")
-            
-            # Create error message
-            message = Message(role="assistant")
-            message.add_content(
-                TextBlock(
-                    f"I'm sorry, I encountered an error while processing your request: {str(e)}"
-                )
+        except (openai.OpenAIError, requests.RequestException, httpx.HTTPError) as e:
+            # Only API and transport failures are reported back as an assistant
+            # message; anything else is a bug and propagates to the caller.
+            # openai only wraps transport errors raised while sending the
+            # request, so errors reading a streamed body arrive as httpx errors.
+            logger.exception("Error in LLM client: %s", e)
+            return Message.from_text(
+                "assistant",
+                f"I'm sorry, I encountered an error while processing your request: {e}",
             )
-            return message
+
+    def warmup(self) -> None:
+        """Load the tokenizer and open a pooled connection to the API."""
+        try:
+            _get_encoding()
+        except Exception as e:
+            logger.debug(f"Could not load the tokenizer ahead of time: {e}")
+        try:
+            # Listing models is free, and the connection is kept alive for reuse
+            self._client.models.list()
+        except Exception as e:
+            logger.debug(f"Could not connect to the API ahead of time: {e}")
 
     def count_tokens(self, request_data: Dict[str, Any]) -> Optional[int]:
         """Calculate token count for messages using tiktoken.
@@ -170,7 +225,7 @@ class OpenRouterProxy(Proxy):
         """
         try:
             # Use tiktoken to count tokens
-            encoding = tiktoken.encoding_for_model("gpt-4")
+            encoding = _get_encoding()
             
             # Count tokens for each message
             total_tokens = 0
@@ -187,7 +242,7 @@ class OpenRouterProxy(Proxy):
                 else:
                     for block in content:
                         if isinstance(block, dict) and "text" in block:
-                            content_tokens += len(encoding.encode(block["text"]))
+                            content_tokens += self._count_text_tokens(encoding, block["text"])
                         elif isinstance(block, str):
                             content_tokens += len(encoding.encode(block))
                 
@@ -201,6 +256,14 @@ class OpenRouterProxy(Proxy):
             logger.warning(f"Error counting tokens: {e}")
             return None
 
+    def _count_text_tokens(self, encoding: "tiktoken.Encoding", text: str) -> int:
+        """Count the tokens of a message text, reusing earlier counts of the same text object."""
+        num_tokens = self._token_counts.get(text)
+        if num_tokens is None:
+            num_tokens = len(encoding.encode(text))
+            self._token_counts.put(text, num_tokens)
+        return num_tokens
+
     def _send_request(
         self, request_data: Dict[str, Any], session_id: str
     ) -> Any:
@@ -214,7 +277,10 @@ class OpenRouterProxy(Proxy):
         Returns:
             The OpenRouter response object
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        # The wall clock is read once per request, and only for the debug files
+        debug = os.environ.get("DEBUG", "").lower() == "true"
+        requested_at = datetime.datetime.now() if debug else None
         try:
             # Log request details
             logger.info(
@@ -245,10 +311,10 @@ class OpenRouterProxy(Proxy):
                     logger.info(f"Last message preview: {preview}")
             
             # Prepare a directory to save debug logs if DEBUG is set
-            if os.environ.get("DEBUG", "").lower() == "true":
+            if debug:
                 debug_dir = Path("./logs/llm_debug")
                 debug_dir.mkdir(parents=True, exist_ok=True)
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = requested_at.strftime("%Y%m%d_%H%M%S")
                 debug_file = debug_dir / f"request_{timestamp}_{session_id}.json"
                 
                 with open(debug_file, "w") as f:
@@ -261,11 +327,11 @@ class OpenRouterProxy(Proxy):
             response = self._client.chat.completions.create(**request_data)
             
             # Log response time
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.info(f"Received response in {duration:.2f} seconds")
             
             # Optionally log full response in debug mode
-            if os.environ.get("DEBUG", "").lower() == "true":
+            if debug:
                 debug_file = debug_dir / f"response_{timestamp}_{session_id}.json"
                 with open(debug_file, "w") as f:
                     f.write(str(response))
@@ -274,7 +340,7 @@ class OpenRouterProxy(Proxy):
             return response
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             logger.error(f"Error sending request after {duration:.2f} seconds: {e}")
             raise
 
@@ -294,7 +360,7 @@ class OpenRouterProxy(Proxy):
 
         retry_delay = 0.1  # seconds
         max_retry_duration = 10  # seconds
-        start_time = time.time()
+        start_time = time.monotonic()
 
         while True:
             try:
@@ -305,11 +371,11 @@ class OpenRouterProxy(Proxy):
                     "data" in response_data
                 ), f"OpenRouter API response missing 'data' field"
                 logger.info(
-                    f"Took {time.time() - start_time} seconds to fetch OpenRouter metadata"
+                    f"Took {time.monotonic() - start_time} seconds to fetch OpenRouter metadata"
                 )
                 return response_data["data"]
             except requests.HTTPError as e:
-                curr_duration = time.time() - start_time
+                curr_duration = time.monotonic() - start_time
                 # Only retry for 404 or 5xx errors
                 if curr_duration > max_retry_duration or not (
                     e.response.status_code == 404 or e.response.status_code >= 500
@@ -318,16 +384,16 @@ class OpenRouterProxy(Proxy):
                 time.sleep(retry_delay)
 
     def _add_openrouter_metadata(
-        self, response, metadata: Dict[str, Any]
+        self, completion_id: str, usage, metadata: Dict[str, Any]
     ) -> Dict[str, Any]:
         metadata = {
             **metadata,
             **{
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens,
-                "total_tokens": response.usage.total_tokens,
+                "prompt_tokens": usage.prompt_tokens,
+                "completion_tokens": usage.completion_tokens,
+                "total_tokens": usage.total_tokens,
             },
-            **self._fetch_openrouter_metadata(response.id),
+            **self._fetch_openrouter_metadata(completion_id),
         }
         return metadata
 
@@ -355,25 +421,63 @@ class OpenRouterProxy(Proxy):
             
         except (AttributeError, IndexError, TypeError) as e:
             logger.exception(f"Invalid response structure: {response}")
-            message = Message(role="assistant")
-            message.add_content(
-                TextBlock("I'm sorry, I encountered an error processing your request.")
+            return Message.from_text(
+                "assistant", "I'm sorry, I encountered an error processing your request."
             )
-            return message
 
         if content is None:
             logger.exception("Response message content is None")
-            message = Message(role="assistant")
-            message.add_content(
-                TextBlock("I'm sorry, I encountered an error processing your request.")
+            return Message.from_text(
+                "assistant", "I'm sorry, I encountered an error processing your request."
             )
-            return message
 
+        return self._build_message(content, response.id, response.usage, request_data)
+
+    def _parse_stream(
+        self, stream, request_data: Dict[str, Any], on_text: Callable[[str], None]
+    ) -> Message:
+        """
+        Consume a streamed response, passing text to on_text as it arrives.
+
+        Args:
+            stream: Iterator of completion chunks
+            request_data: Request data dictionary
+            on_text: Callback receiving each piece of response text
+
+        Returns:
+            Message: The complete response as a Message object
+        """
+        parts = []
+        completion_id = None
+        usage = None
+        try:
+            for chunk in stream:
+                completion_id = chunk.id
+                # With include_usage, the final chunk carries usage and no choices
+                if chunk.usage is not None:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                text = chunk.choices[0].delta.content
+                if text:
+                    parts.append(text)
+                    on_text(text)
+        except Exception:
+            # Release the connection of a response that was not read to the end
+            stream.close()
+            raise
+
+        return self._build_message("".join(parts), completion_id, usage, request_data)
+
+    def _build_message(
+        self, content, completion_id: Optional[str], usage, request_data: Dict[str, Any]
+    ) -> Message:
+        """Build the response message and its metadata from the response content."""
         # Basic metadata with usage stats
         metadata = {"approx_num_tokens": self.count_tokens(request_data)}
         # Add additional metadata for OpenRouter completions
-        if self.api_url and "openrouter.ai" in self.api_url:
-            metadata = self._add_openrouter_metadata(response, metadata)
+        if self.api_url and "openrouter.ai" in self.api_url and usage is not None:
+            metadata = self._add_openrouter_metadata(completion_id, usage, metadata)
         
         if isinstance(content, str):
             content = [TextBlock(content)]
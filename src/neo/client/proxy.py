@@ -5,7 +5,7 @@ Each proxy implements the same interface but connects to a different backend.
 
 import os
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Optional
 from abc import ABC, abstractmethod
 
 from src.neo.core.messages import Message
@@ -27,6 +27,7 @@ class Proxy(ABC):
         model: Optional[str] = None,
         stop: List[str] = None,
         session_id: Optional[str] = None,
+        on_text: Optional[Callable[[str], None]] = None,
     ) -> Message:
         """
         Process a conversation with the LLM and return the response.
@@ -36,6 +37,8 @@ class Proxy(ABC):
             model: Optional model identifier to override the default model
             stop: Optional list of stop sequences
             session_id: Optional session identifier for tracking
+            on_text: Optional callback that receives the response text as it is
+                streamed. The returned message remains the complete response.
 
         Returns:
             Message: LLM's response as a Message object
@@ -45,6 +48,12 @@ class Proxy(ABC):
         """
         pass
 
+    def warmup(self) -> None:
+        """
+        Load what the first request needs ahead of time, so it is not paid for
+        by the first message. Proxies with nothing to load keep this default.
+        """
+
     @staticmethod
     def get_proxy() -> 'Proxy':
         """
@@ -175,8 +175,14 @@ class Command(ABC):
     - help(): Returns detailed description with examples and parameter lists
     - validate(): Validates that a given command statement is valid
     - execute(): Executes the command and returns a CommandResult
+
+    Subclasses may set parallel_safe to True if the command does not modify
+    shared state, which lets the Shell run it concurrently with other
+    parallel-safe commands from the same message.
     """
 
+    parallel_safe: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
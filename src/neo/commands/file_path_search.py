@@ -42,6 +42,9 @@ class FilePathSearch(Command):
     - Uses the workspace from the Session
     """
 
+    # Read-only, so it can run alongside other read-only commands
+    parallel_safe = True
+
     @property
     def name(self) -> str:
         """Return the command name."""
@@ -44,6 +44,9 @@ class FileTextSearch(Command):
     - Provides context lines around matches
     """
 
+    # Read-only, so it can run alongside other read-only commands
+    parallel_safe = True
+
     @property
     def name(self) -> str:
         """Return the command name."""
@@ -45,6 +45,9 @@ class ReadFileCommand(Command):
     - Shows indicators when content is truncated
     """
 
+    # Read-only, so it can run alongside other read-only commands
+    parallel_safe = True
+
     @property
     def name(self) -> str:
         """Return the command name."""
@@ -0,0 +1,150 @@
+"""
+Recall archive command implementation.
+
+This module provides the RecallArchiveCommand class for searching messages
+that were pruned from the conversation state.
+"""
+
+import argparse
+import logging
+import os
+import re
+import shlex
+import textwrap
+from dataclasses import dataclass
+from typing import List, Optional
+
+from src.neo.agent.journal import ARCHIVE_FILE_NAME
+from src.neo.commands.base import Command
+from src.neo.core.messages import CommandOutput, CommandResult, Message
+from src.utils import serialization
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RecallArchiveArgs:
+    """Structured arguments for recall_archive command."""
+    pattern: str
+    limit: int = 5
+
+
+class RecallArchiveCommand(Command):
+    """
+    Command for searching messages pruned from the conversation.
+
+    Features:
+    - Searches the archive of messages dropped when the conversation is pruned
+    - Case-insensitive regex matching on message text
+    - Returns the most recent matches first
+    """
+
+    # Read-only, so it can run alongside other read-only commands
+    parallel_safe = True
+
+    # Maximum number of characters shown per matching message
+    MAX_MESSAGE_CHARS = 2000
+
+    @property
+    def name(self) -> str:
+        """Return the command name."""
+        return "recall_archive"
+
+    def description(self) -> str:
+        """Returns a short description of the command."""
+        return "Search earlier messages that were pruned from the conversation."
+
+    def help(self) -> str:
+        """Returns detailed help for the command."""
+        return textwrap.dedent(
+            """
+            Use the `recall_archive` command to search earlier parts of this conversation
+            that are no longer in your context. Checkpoints summarize them; use this
+            command when you need details the checkpoints left out.
+
+            Usage: ▶recall_archive PATTERN [--limit <limit>]■
+
+            - PATTERN (required): Case-insensitive regex to look for in archived messages
+            - limit: Maximum number of messages to return, most recent first. Default: 5
+
+            Example:
+
+            ▶recall_archive "database schema"■
+            ✅[user] Please keep the database schema in src/db/schema.sql■
+            """
+        )
+
+    def _parse_statement(self, statement: str, data: Optional[str] = None) -> RecallArchiveArgs:
+        """Parse the command statement using argparse."""
+        # Validate that data parameter is not set
+        if data:
+            raise ValueError("The recall_archive command does not accept data input")
+
+        parser = argparse.ArgumentParser(prog="recall_archive", exit_on_error=False)
+        parser.add_argument("pattern", help="Regex pattern to look for in archived messages")
+        parser.add_argument("--limit", type=int, default=5, help="Maximum number of messages to return")
+
+        parsed_args = parser.parse_args(shlex.split(statement))
+        return RecallArchiveArgs(pattern=parsed_args.pattern, limit=parsed_args.limit)
+
+    def validate(self, session, statement: str, data: Optional[str] = None) -> None:
+        """Validate the recall_archive command statement."""
+        args = self._parse_statement(statement, data)
+        if args.limit <= 0:
+            raise ValueError("Error: limit must be a positive number")
+        try:
+            re.compile(args.pattern)
+        except re.error as e:
+            raise ValueError(f"Invalid pattern: {e}")
+
+    def execute(
+        self, session, statement: str, data: Optional[str] = None
+    ) -> CommandResult:
+        """Execute the recall_archive command."""
+        self.validate(session, statement, data)
+        args = self._parse_statement(statement, data)
+
+        archive_path = os.path.join(session.internal_session_dir, ARCHIVE_FILE_NAME)
+        matches = self._search(archive_path, re.compile(args.pattern, re.IGNORECASE), args.limit)
+
+        if not matches:
+            content = "No archived messages match the pattern."
+        else:
+            content = "\n\n".join(matches)
+
+        return CommandResult(
+            content=content,
+            success=True,
+            command_output=CommandOutput(
+                name="recall_archive",
+                message=f"Found {len(matches)} archived messages",
+            ),
+        )
+
+    def _search(self, archive_path: str, pattern: re.Pattern, limit: int) -> List[str]:
+        """Return up to limit matching messages, most recent first."""
+        try:
+            with open(archive_path, "rb") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+
+        matches = []
+        for line in reversed(lines):
+            try:
+                entry = serialization.loads(line)
+            except ValueError:
+                # A partially written line from an interrupted append
+                logger.debug("Skipping malformed entry in %s", archive_path)
+                continue
+            message = Message.from_dict(entry)
+            text = message.model_text()
+            if not pattern.search(text):
+                continue
+            if len(text) > self.MAX_MESSAGE_CHARS:
+                text = text[: self.MAX_MESSAGE_CHARS] + "..."
+            matches.append(f"[{message.role}] {text}")
+            if len(matches) == limit:
+                break
+        return matches
@@ -4,9 +4,10 @@ Message classes for representing conversation content.
 
 import json
 import re
+import sys
 import dataclasses
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, Set, Union, Protocol, runtime_checkable, TYPE_CHECKING
+from typing import Dict, Any, List, Optional, Set, Tuple, Union, Protocol, runtime_checkable, TYPE_CHECKING
 from abc import ABC, abstractmethod
 
 # Use forward references to avoid circular imports
@@ -44,7 +45,13 @@ class ParsedCommand:
 
 
 class ContentBlock:
-    """Base class for different types of content in a message."""
+    """Base class for different types of content in a message.
+
+    Content blocks are allocated for every message in the conversation, so the
+    built-in block types declare __slots__ to avoid a per-instance __dict__.
+    """
+
+    __slots__ = ()
 
     def __str__(self) -> str:
         return self.model_text()
@@ -86,6 +93,8 @@ class ContentBlock:
 class TextBlock(ContentBlock):
     """Represents a text content block in a message."""
 
+    __slots__ = ("_text",)
+
     def __init__(self, text: str):
         self._text = text
 
@@ -105,6 +114,8 @@ class TextBlock(ContentBlock):
 class CommandCall(ContentBlock):
     """Represents a command call content block in a message."""
 
+    __slots__ = ("content", "parsed_cmd")
+
     def __init__(self, content: str, parsed_cmd: Optional["ParsedCommand"] = None):
         self.content = content
         self.parsed_cmd = parsed_cmd
@@ -122,6 +133,21 @@ class CommandCall(ContentBlock):
         return cls(content=data.get("value", ""))
 
 
+# Special characters that must be escaped inside command results
+_SPECIAL_CHARS = (COMMAND_START, COMMAND_END, STDIN_SEPARATOR, ERROR_PREFIX, SUCCESS_PREFIX)
+
+# Escaped \u{hex} representation of each special character and its reverse
+_ESCAPED_CHARS = {char: f"\\u{ord(char):x}" for char in _SPECIAL_CHARS}
+_UNESCAPED_CHARS = {f"{ord(char):x}": char for char in _SPECIAL_CHARS}
+
+# Translation table for escaping; built once since escaping runs every time a
+# command result is rendered for the model, and str.translate needs no callback
+_ESCAPE_TABLE = str.maketrans(_ESCAPED_CHARS)
+
+# Pattern matching the escape sequences of our special characters only
+_UNESCAPE_PATTERN = re.compile(f"\\\\u({'|'.join(_UNESCAPED_CHARS)})")
+
+
 def _escape_special_chars(content: str) -> str:
     r"""
     Replace special command characters with their escaped unicode representation.
@@ -132,23 +158,7 @@ def _escape_special_chars(content: str) -> str:
     Returns:
         Content with special characters replaced
     """
-
-    # Escape function to replace special characters with \u{hex} format
-    def escape_special_chars(match):
-        char = match.group(0)
-        # Format the character's code point as a hex string - use raw string to avoid backslash escaping
-        return f"\\u{ord(char):x}"
-
-    # Create pattern of all special characters
-    special_chars = "".join(
-        [COMMAND_START, COMMAND_END, STDIN_SEPARATOR, ERROR_PREFIX, SUCCESS_PREFIX]
-    )
-    pattern = f"[{re.escape(special_chars)}]"
-
-    # Escape all special characters in the content
-    result = re.sub(pattern, escape_special_chars, content)
-
-    return result
+    return content.translate(_ESCAPE_TABLE)
 
 
 def _unescape_special_chars(content: str) -> str:
@@ -165,33 +175,11 @@ def _unescape_special_chars(content: str) -> str:
     if content is None:
         return ""
 
-    # Create a mapping of hex codes to special characters
-    hex_to_char = {
-        f"{ord(COMMAND_START):x}": COMMAND_START,
-        f"{ord(COMMAND_END):x}": COMMAND_END,
-        f"{ord(STDIN_SEPARATOR):x}": STDIN_SEPARATOR,
-        f"{ord(ERROR_PREFIX):x}": ERROR_PREFIX,
-        f"{ord(SUCCESS_PREFIX):x}": SUCCESS_PREFIX,
-    }
+    return _UNESCAPE_PATTERN.sub(_unescape_match, content)
 
-    # Function to replace only specific escape sequences
-    def unescape_specific_chars(match):
-        # Extract the hex code
-        hex_code = match.group(1)
-        # Only replace if it's one of our special characters
-        if hex_code in hex_to_char:
-            return hex_to_char[hex_code]
-        # Otherwise keep the original
-        return match.group(0)
 
-    # Pattern to match our specific escape sequences
-    hex_codes = "|".join(hex_to_char.keys())
-    pattern = f"\\\\u({hex_codes})"
-
-    # Replace only our specific escaped sequences
-    result = re.sub(pattern, unescape_specific_chars, content)
-
-    return result
+def _unescape_match(match: re.Match) -> str:
+    return _UNESCAPED_CHARS[match.group(1)]
 
 
 @dataclass
@@ -209,6 +197,8 @@ class CommandOutput:
 class CommandResult(ContentBlock):
     """Represents a command result content block in a message."""
 
+    __slots__ = ("content", "success", "error", "command_call", "command_output")
+
     def __init__(
         self,
         content: str,
@@ -258,6 +248,8 @@ class CommandResult(ContentBlock):
 class StructuredOutput(CommandResult):
     """Represents a structured output content block in a message."""
 
+    __slots__ = ("value", "destination")
+
     def __init__(
         self, content: str, value: Optional[Any] = None, destination: str = "default"
     ):
@@ -284,7 +276,7 @@ class StructuredOutput(CommandResult):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """
     Represents a message in the conversation with role and content blocks.
@@ -293,6 +285,11 @@ class Message:
     content: List[ContentBlock]
     metadata: Dict[str, Any] = field(default_factory=dict)
     assistant_prefill: Optional[str] = None
+    # Serialized content blocks, reused by to_dict while the content list is
+    # unchanged. Messages are persisted repeatedly but rarely modified.
+    _content_dicts: Optional[Tuple[List[ContentBlock], int, List[Dict[str, Any]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         # Handle string content by converting to TextBlock
@@ -310,6 +307,28 @@ class Message:
         """Factory method to create a Message with default values."""
         return cls(role=role, content=content, **kwargs)
 
+    @classmethod
+    def from_text(
+        cls,
+        role: str,
+        text: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        assistant_prefill: Optional[str] = None,
+    ) -> "Message":
+        """
+        Fast-path factory for a message with a single TextBlock.
+
+        The content is known to be valid, so this skips the str handling and
+        block validation done in __post_init__.
+        """
+        message = cls.__new__(cls)
+        message.role = role
+        message.content = [TextBlock(text)]
+        message.metadata = {} if metadata is None else metadata
+        message.assistant_prefill = assistant_prefill
+        message._content_dicts = None
+        return message
+
     def add_content(self, content: ContentBlock) -> None:
         assert isinstance(content, ContentBlock), "Content must be a ContentBlock"
         self.content.append(content)
@@ -329,13 +348,11 @@ class Message:
         return [block for block in self.content if isinstance(block, CommandResult)]
 
     def structured_output(self) -> Optional[StructuredOutput]:
-        structured_output_blocks = [
-            block
-            for block in self.command_results()
-            if isinstance(block, StructuredOutput)
-        ]
-        if structured_output_blocks:
-            return structured_output_blocks[0]
+        # Called several times per agent step, so stop at the first match instead
+        # of materializing the command results and then filtering them again
+        for block in self.content:
+            if isinstance(block, StructuredOutput):
+                return block
         return None
 
     def model_text(self) -> str:
@@ -350,21 +367,28 @@ class Message:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert Message to a dictionary for serialization."""
+        content = self.content
+        cached = self._content_dicts
+        if cached is None or cached[0] is not content or cached[1] != len(content):
+            cached = (content, len(content), [block.to_dict() for block in content])
+            self._content_dicts = cached
         return {
             "role": self.role,
-            "content": [block.to_dict() for block in self.content],
+            "content": cached[2],
             "metadata": self.metadata,
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Message":
         """Create Message from a dictionary."""
-        content_blocks = []
-        for item in data.get("content", []):
-            content_blocks.append(ContentBlock.create_from_dict(item))
+        content_blocks = [
+            ContentBlock.create_from_dict(item) for item in data.get("content", [])
+        ]
 
+        # Roles decoded from JSON are new strings for every message; interning
+        # shares one object per role across long loaded histories
         return cls(
-            role=data.get("role", "user"),
+            role=sys.intern(data.get("role", "user")),
             content=content_blocks,
             metadata=data.get("metadata", {}),
         )
@@ -7,7 +7,7 @@ Provides methods for managing session data in the database.
 import logging
 import sqlite3
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from src.neo.service.database.connection import DatabaseConnection
 
@@ -15,7 +15,17 @@ logger = logging.getLogger(__name__)
 
 class SessionRepository:
     """Repository for session data in the SQLite database."""
-    
+
+    # Rows returned by list_sessions for each include_temporary, with the
+    # connection and data_version they were read at. SQLite changes
+    # data_version when another connection commits, so the rows are only read
+    # again after someone else may have changed them. Commits through this
+    # class leave data_version unchanged, so the methods that change sessions
+    # clear the cache instead.
+    _session_lists: Optional[
+        Tuple[sqlite3.Connection, int, Dict[bool, List[Dict[str, Any]]]]
+    ] = None
+
     def __init__(self):
         self._db = DatabaseConnection().get_connection()
     
@@ -85,6 +95,7 @@ class SessionRepository:
             (session_id, name, 1 if is_temporary else 0, workspace, current_time, current_time)
         )
         self._db.commit()
+        SessionRepository._session_lists = None
         
         return self.find_session_by_id(session_id)
     
@@ -139,6 +150,7 @@ class SessionRepository:
             query = f"UPDATE sessions SET {', '.join(update_fields)} WHERE session_id = ?"
             cursor.execute(query, params)
             self._db.commit()
+            SessionRepository._session_lists = None
         
         return self.find_session_by_id(session_id)
     
@@ -155,6 +167,7 @@ class SessionRepository:
         cursor = self._db.cursor()
         cursor.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
         self._db.commit()
+        SessionRepository._session_lists = None
         return cursor.rowcount > 0
     
     def list_sessions(self, include_temporary: bool = False) -> List[Dict[str, Any]]:
@@ -167,14 +180,26 @@ class SessionRepository:
         Returns:
             List of session data dictionaries
         """
-        cursor = self._db.cursor()
-        
-        if include_temporary:
-            cursor.execute("SELECT * FROM sessions ORDER BY created_at DESC")
-        else:
-            cursor.execute("SELECT * FROM sessions WHERE is_temporary = 0 ORDER BY created_at DESC")
-        
-        return [dict(row) for row in cursor.fetchall()]
+        data_version = self._data_version()
+        cached = SessionRepository._session_lists
+        if cached is None or cached[0] is not self._db or cached[1] != data_version:
+            cached = (self._db, data_version, {})
+            SessionRepository._session_lists = cached
+
+        rows = cached[2].get(include_temporary)
+        if rows is None:
+            cursor = self._db.cursor()
+
+            if include_temporary:
+                cursor.execute("SELECT * FROM sessions ORDER BY created_at DESC")
+            else:
+                cursor.execute("SELECT * FROM sessions WHERE is_temporary = 0 ORDER BY created_at DESC")
+
+            rows = [dict(row) for row in cursor.fetchall()]
+            cached[2][include_temporary] = rows
+
+        # Copies, so callers cannot change the cached rows
+        return [dict(row) for row in rows]
     
     def get_last_created_session(self, include_temporary: bool = False) -> Optional[Dict[str, Any]]:
         """
@@ -225,3 +250,6 @@ class SessionRepository:
         cursor.execute("SELECT value FROM settings WHERE key = 'last_active_session'")
         result = cursor.fetchone()
         return result['value'] if result else None
+
+    def _data_version(self) -> int:
+        return self._db.execute("PRAGMA data_version").fetchone()[0]
@@ -1,5 +1,5 @@
 import logging
-from typing import Iterable, Optional, List, Dict, Any
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 # Import from the new module structure
 from src.neo.core.messages import Message
@@ -16,7 +16,13 @@ class Service:
     """
 
     @classmethod
-    def message(cls, msg: str, session_id: Optional[str] = None) -> Iterable[Message]:
+    def message(
+        cls,
+        msg: str,
+        session_id: Optional[str] = None,
+        on_text: Optional[Callable[[str], None]] = None,
+        on_retry: Optional[Callable[[], None]] = None,
+    ) -> Iterable[Message]:
         """Sends a user message to the specified session's agent.
         
         If session_id is None, creates a temporary session.
@@ -24,6 +30,10 @@ class Service:
         Args:
             msg: The message to process
             session_id: Session ID to use, or None to create a temporary session
+            on_text: Optional callback that receives the assistant's text as it
+                is streamed, ahead of the complete messages
+            on_retry: Optional callback called when the streamed text is
+                superseded by a new attempt at the response
             
         Returns:
             Generator yielding response messages
@@ -40,7 +50,20 @@ class Service:
             logger.info("Service.message: Creating temporary session for message")
             session = SessionManager.create_temporary_session()
 
-        yield from session.agent.process(msg)
+        yield from session.agent.process(msg, on_text, on_retry)
+
+    @classmethod
+    def prepare_session(cls, session_id: str) -> None:
+        """Loads a session and its agent so that its next message starts sooner.
+
+        Args:
+            session_id: ID of the session to load
+
+        Raises:
+            ValueError: If session with the given ID doesn't exist
+        """
+        if not SessionManager.get_session(session_id):
+            raise ValueError(f"Session not found: {session_id}")
 
     @classmethod
     def create_session(cls, session_name: Optional[str] = None, workspace: Optional[str] = None) -> SessionInfo:
@@ -102,11 +125,8 @@ class Service:
     def get_session(cls, session_id: str) -> Optional[SessionInfo]:
         """Retrieves the persisted state of a session by its ID."""
         logger.debug("Service attempting to get session state for ID: %s", session_id)
-        session = SessionManager.get_session(session_id)
-        if not session:
-            return None
-        
-        return SessionInfo(session_id=session.session_id, session_name=session.session_name)
+        # The session itself is loaded when it is first used
+        return SessionManager.get_session_info(session_id)
 
     @classmethod
     def list_sessions(cls) -> list[SessionInfo]:
@@ -127,16 +147,9 @@ class Service:
             SessionInfo with details about the last active session, or None if no active session exists
         """
         logger.info("Service getting last active session.")
-        session = SessionManager.get_last_active_session()
-        
-        if not session:
-            return None
-            
-        return SessionInfo(
-            session_id=session.session_id, 
-            session_name=session.session_name, 
-            workspace=session.workspace
-        )
+        # Only the stored details are read; the chat loads the session itself
+        # in the background while the user types
+        return SessionManager.get_last_active_session_info()
     
     @classmethod
     def history(cls, session_id: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -95,6 +95,29 @@ class SessionManager:
         cls._session_cache[session_id] = session
         return session
 
+    @classmethod
+    def get_session_info(cls, session_id: str) -> Optional[SessionInfo]:
+        """
+        Get the name and workspace of a session without initializing it.
+
+        Args:
+            session_id: The ID of the session to look up
+
+        Returns:
+            SessionInfo for the session if found, otherwise None
+        """
+        session = cls._session_cache.get(session_id)
+        if session is not None:
+            return SessionInfo(session_id=session.session_id, session_name=session.session_name, workspace=session.workspace)
+
+        repository = cls._get_repository()
+        session_data = repository.find_session_by_id(session_id)
+
+        if not session_data:
+            return None
+
+        return SessionInfo(session_id=session_data["session_id"], session_name=session_data["session_name"], workspace=session_data.get("workspace"))
+
     @classmethod
     def list_sessions(cls, include_temporary: bool = False) -> list[SessionInfo]:
         """
@@ -173,6 +196,22 @@ class SessionManager:
 
         return cls.get_session(session_id)
 
+    @classmethod
+    def get_last_active_session_info(cls) -> Optional[SessionInfo]:
+        """
+        Get the name and workspace of the last active session without initializing it.
+
+        Returns:
+            SessionInfo for the last active session, or None if no active session exists
+        """
+        repository = cls._get_repository()
+        session_id = repository.get_last_active_session_id()
+
+        if not session_id:
+            return None
+
+        return cls.get_session_info(session_id)
+
     @classmethod
     def get_last_created_session(cls, include_temporary: bool = False) -> Optional["Session"]:
         """
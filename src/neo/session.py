@@ -3,6 +3,7 @@ Session module providing a dataclass for storing session information.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import os
 from typing import Optional, TYPE_CHECKING, Dict
@@ -16,6 +17,12 @@ if TYPE_CHECKING:
     from src.neo.agent import Agent
 
 
+@lru_cache(maxsize=64)
+def _internal_session_dir(session_id: str) -> str:
+    """The internal directory of a session, expanded once per session ID."""
+    return os.path.expanduser(f"{NEO_HOME}/{session_id}")
+
+
 @dataclass
 class Session:
     """
@@ -91,7 +98,7 @@ class Session:
     @property
     def internal_session_dir(self) -> str:
         """Get the internal session directory path (<NEO_HOME>/<session_id>)."""
-        return os.path.expanduser(f"{NEO_HOME}/{self.session_id}")
+        return _internal_session_dir(self.session_id)
 
     @property
     def agent(self) -> "Agent":
@@ -10,7 +10,7 @@ import jsonschema
 import json
 import concurrent.futures
 from concurrent.futures import Future
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 from src.neo.core.messages import CommandResult, CommandCall, StructuredOutput, ParsedCommand, OutputType, PrimitiveOutputType
 from src.neo.commands.base import Command
@@ -19,6 +19,7 @@ from src.neo.commands.write_file import WriteFileCommand
 from src.neo.commands.update_file import UpdateFileCommand
 from src.neo.commands.file_text_search import FileTextSearch
 from src.neo.commands.file_path_search import FilePathSearch
+from src.neo.commands.recall_archive import RecallArchiveCommand
 from src.neo.commands.terminal import ShellRunCommand, ShellViewCommand, ShellWriteCommand, ShellTerminateCommand
 from src.neo.commands.web_search import WebSearchCommand
 from src.neo.commands.web_markdown import WebMarkdownCommand
@@ -36,6 +37,8 @@ class Shell:
 
     def __init__(self, session: Session):
         self._commands: Dict[str, Command] = {}
+        # Names of the registered commands, built on first use after a registration
+        self._command_names: Optional[Tuple[str, ...]] = None
         self._session = session
         # Create a single thread pool executor for async command execution
         self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)
@@ -58,6 +61,7 @@ class Shell:
             raise ValueError(f"Command '{name}' is already registered")
 
         self._commands[name] = command
+        self._command_names = None
         logger.debug(f"Registered command: {name}")
 
     def register_commands(self, commands: List[Command]) -> None:
@@ -77,16 +81,21 @@ class Shell:
         Raises:
             ValueError: If the command is not registered
         """
-        if command_name not in self._commands:
+        command = self._commands.get(command_name)
+        if command is None:
             raise ValueError(f"Command '{command_name}' is not registered")
 
-        return self._commands[command_name]
+        return command
 
-    def list_commands(self) -> List[str]:
+    def list_commands(self) -> Tuple[str, ...]:
         """
-        Get a list of all registered command names.
+        Get the names of all registered commands.
+
+        The tuple is built once and shared until another command is registered.
         """
-        return list(self._commands.keys())
+        if self._command_names is None:
+            self._command_names = tuple(self._commands)
+        return self._command_names
 
     def _parse(self, command_input: str) -> ParsedCommand:
         """
@@ -226,7 +235,7 @@ class Shell:
         """
         try:
             command = self._get_command(command_name)
-            logger.debug(f"Executing command '{command_name}' with: {statement}")
+            logger.debug("Executing command '%s' with: %s", command_name, statement)
             result = command.execute(self._session, statement, data)
             
             # Add command_call to the result
@@ -270,37 +279,35 @@ class Shell:
             len(commands) > 0
         ), f"Expected at least one command call, got {len(commands)}"
 
-        # Create a list to collect all command results
-        result_blocks = []
-
-        # Execute each command and collect the results
+        # Parse all commands up front so that a batch of read-only commands can
+        # run concurrently on the executor. Results keep the order of the calls.
+        parsed_cmds: List[Union[ParsedCommand, Exception]] = []
         for cmd_call in commands:
-            # Parse the command
             statement = cmd_call.content[1:-1]  # Remove markers
-            
             try:
-                parsed_cmd = self._parse(statement)
-                
-                # For handling commands with empty statement before pipe
-                # Only pass the statement if it's not empty
-                cmd_statement = "" if parsed_cmd.name == statement.strip() else statement
-                
-                # Execute the command
-                result = self.execute(
-                    parsed_cmd.name, parsed_cmd.parameters, parsed_cmd.data
-                )
+                parsed_cmds.append(self._parse(statement))
+            except Exception as e:
+                parsed_cmds.append(e)
 
+        run_parallel = len(parsed_cmds) > 1 and all(
+            isinstance(parsed_cmd, ParsedCommand)
+            and self._commands[parsed_cmd.name].parallel_safe
+            for parsed_cmd in parsed_cmds
+        )
+        if run_parallel:
+            results = list(self._executor.map(self._execute_parsed, parsed_cmds))
+        else:
+            results = [self._execute_parsed(parsed_cmd) for parsed_cmd in parsed_cmds]
+
+        result_blocks = []
+        for parsed_cmd, result in zip(parsed_cmds, results):
+            if isinstance(parsed_cmd, ParsedCommand):
                 result.command_call = parsed_cmd
-                # Add the result to our collection
-                result_blocks.append(result)
-            except Exception as e:
-                # Create an error result and add it to our collection
-                error_result = CommandResult(content=str(e), success=False, error=e)
-                result_blocks.append(error_result)
+            result_blocks.append(result)
 
         for result in result_blocks:
             if result.success:
-                logger.info(f"Command result: {result.content}")
+                logger.info("Command result: %s", result.content)
             else:
                 error_message = result.content + (
                     f"\n{traceback.format_exception(result.error)}" if result.error else ""
@@ -309,6 +316,14 @@ class Shell:
 
         return result_blocks
 
+    def _execute_parsed(
+        self, parsed_cmd: Union[ParsedCommand, Exception]
+    ) -> CommandResult:
+        """Execute a parsed command, or turn a parse error into a failed result."""
+        if isinstance(parsed_cmd, Exception):
+            return CommandResult(content=str(parsed_cmd), success=False, error=parsed_cmd)
+        return self.execute(parsed_cmd.name, parsed_cmd.parameters, parsed_cmd.data)
+
     def describe(self, command_name: str) -> str:
         """
         Get the manual documentation for a command.
@@ -330,6 +345,9 @@ class Shell:
         self.register_command(FileTextSearch())
         self.register_command(FilePathSearch())
 
+        # Register conversation archive search
+        self.register_command(RecallArchiveCommand())
+
         # Register shell commands
         self.register_command(ShellRunCommand())
         self.register_command(ShellViewCommand())
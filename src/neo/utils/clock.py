@@ -104,10 +104,10 @@ class FakeClock(Clock):
             raise ValueError("Number of threads must be at least 1")
             
         with self._sleep_condition:
-            start_time = time.time()
+            start_time = time.monotonic()
             while self._sleeping_threads != num_threads:
                 if timeout is not None:
-                    elapsed = time.time() - start_time
+                    elapsed = time.monotonic() - start_time
                     if elapsed >= timeout:
                         return False
                     remaining = timeout - elapsed
@@ -0,0 +1,48 @@
+"""
+Caching utilities.
+
+This module provides an identity-keyed LRU cache for values derived from
+objects that are not hashable (such as Message dataclasses) but are reused
+unchanged across calls.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Generic, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class IdentityLRUCache(Generic[V]):
+    """
+    Bounded LRU cache keyed by object identity.
+
+    A strong reference to each key object is kept alongside its value, so the
+    id of a cached object cannot be reused by another object while the entry
+    is present. The cache can be shared between threads.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[int, Tuple[Any, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, obj: Any) -> Optional[V]:
+        """Return the value cached for obj, or None if there is none."""
+        with self._lock:
+            entry = self._entries.get(id(obj))
+            if entry is None or entry[0] is not obj:
+                return None
+            self._entries.move_to_end(id(obj))
+            return entry[1]
+
+    def put(self, obj: Any, value: V) -> None:
+        """Cache value for obj, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[id(obj)] = (obj, value)
+            self._entries.move_to_end(id(obj))
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,95 @@
+"""
+Minimal .env file loader.
+
+Parses KEY=VALUE files with the subset of dotenv syntax used by Neo:
+comments, blank lines, an optional ``export`` prefix, and single or double
+quoted values. Variables already present in the environment are never
+overridden.
+"""
+
+import os
+import re
+from typing import Dict, Optional
+
+# KEY=VALUE, optionally prefixed by "export"
+_LINE_PATTERN = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_.]*)\s*=\s*(.*?)\s*$")
+
+_ESCAPES = {"\\n": "\n", "\\t": "\t", '\\"': '"', "\\\\": "\\"}
+_ESCAPE_PATTERN = re.compile(r"\\[nt\"\\]")
+
+
+def parse_env(text: str) -> Dict[str, str]:
+    """
+    Parse the contents of a .env file.
+
+    Args:
+        text: Contents of the file
+
+    Returns:
+        Dictionary of variable names to values, in file order
+    """
+    values = {}
+    for line in text.splitlines():
+        match = _LINE_PATTERN.match(line)
+        if not match:
+            continue
+
+        key, value = match.groups()
+        if value[:1] in ("'", '"') and value.rfind(value[0]) > 0:
+            quote = value[0]
+            value = value[1 : value.rfind(quote)]
+            if quote == '"':
+                value = _ESCAPE_PATTERN.sub(lambda m: _ESCAPES[m.group(0)], value)
+        else:
+            # Unquoted values end at an inline comment
+            value = value.partition(" #")[0].rstrip()
+
+        values[key] = value
+    return values
+
+
+def find_env_file(start_dir: str, filename: str = ".env") -> Optional[str]:
+    """
+    Find the closest .env file in start_dir or one of its parents.
+
+    Args:
+        start_dir: Directory to start searching from
+        filename: Name of the file to look for
+
+    Returns:
+        Path to the file, or None if no file was found
+    """
+    current = os.path.abspath(start_dir)
+    while True:
+        candidate = os.path.join(current, filename)
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def load_env(path: Optional[str]) -> bool:
+    """
+    Load variables from a .env file into os.environ without overriding
+    existing values.
+
+    Args:
+        path: Path to the .env file
+
+    Returns:
+        True if the file was found and loaded, False otherwise
+    """
+    if not path:
+        return False
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+    except OSError:
+        return False
+
+    for key, value in parse_env(text).items():
+        os.environ.setdefault(key, value)
+    return True
@@ -0,0 +1,119 @@
+"""
+Logging handlers for the Neo application.
+
+This module provides a BufferedRotatingFileHandler that keeps log output in a
+large write buffer instead of flushing every record to disk, and a
+CachedTimeFormatter that formats each second's timestamp only once.
+"""
+
+import logging
+import logging.handlers
+import threading
+import time
+from typing import Optional, Tuple
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted timestamp for records logged within
+    the same second.
+
+    Only applies when datefmt has no sub-second fields, which is always the
+    case for time.strftime formats.
+    """
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt)
+        # (second, formatted time) of the last formatted record; replaced as a
+        # whole so formatting from several threads never sees a torn pair
+        self._last_time: Tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        last_second, formatted = self._last_time
+        if second != last_second:
+            formatted = time.strftime(datefmt, self.converter(record.created))
+            self._last_time = (second, formatted)
+        return formatted
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Size-rotated file handler that buffers writes.
+
+    Records below flush_level stay in the stream buffer until it fills up, a
+    record at or above flush_level is emitted, the periodic flush runs, or the
+    handler is closed (logging.shutdown() closes all handlers at exit).
+
+    The file size is tracked in memory instead of seeking to the end of the
+    file for every record, which would otherwise flush the buffer.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: Optional[str] = None,
+        buffer_size: int = 1 << 16,
+        flush_level: int = logging.WARNING,
+        flush_interval: float = 30.0,
+    ):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self._size = 0
+        super().__init__(
+            filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding
+        )
+
+        # Flush periodically so buffered records reach disk on an idle process
+        self._closed = threading.Event()
+        if flush_interval > 0:
+            threading.Thread(
+                target=self._flush_periodically,
+                args=(flush_interval,),
+                daemon=True,
+                name="LogFlusher",
+            ).start()
+
+    def _open(self):
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        self._size = stream.tell()
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if 0 < self.maxBytes <= self._size + len(msg) and self._size > 0:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+
+            self.stream.write(msg)
+            self._size += len(msg)
+
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._closed.wait(interval):
+            self.flush()
+
+    def close(self) -> None:
+        self._closed.set()
+        super().close()
@@ -10,7 +10,6 @@ import os
 import re
 import subprocess
 import select
-import signal
 import time
 import threading
 import shlex
@@ -252,9 +251,9 @@ class Terminal:
         """Get current command status, optionally waiting for completion."""
         self._validate_command_submitted()
 
-        start_time = time.time()
+        start_time = time.monotonic()
         current_status = self._get_command_status()
-        while time.time() - start_time < timeout and current_status.running:
+        while time.monotonic() - start_time < timeout and current_status.running:
             time.sleep(0.1)
             current_status = self._get_command_status()
 
@@ -131,10 +131,10 @@ class Browser:
         logger.info(f"Navigating to {url}")
         try:
             self._page.goto(url, wait_until='domcontentloaded')
-            timeout = time.time() + PAGE_LOAD_TIMEOUT
+            timeout = time.monotonic() + PAGE_LOAD_TIMEOUT
             
             while not self._is_page_stable():
-                if time.time() > timeout:
+                if time.monotonic() > timeout:
                     logger.warning("Page load timeout reached")
                     break
                 time.sleep(0.1)
@@ -0,0 +1,58 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.apps import chat
+from src.apps.chat import (
+    COMMAND_HANDLERS,
+    COMMANDS,
+    TerminateChat,
+    _find_session,
+    handle_command,
+    handle_keyboard_interrupt,
+)
+from src.neo.service.session_manager import SessionInfo
+
+
+def test_sessions_are_found_by_id_name_or_unique_prefix():
+    """Test that /switch accepts what /list shows, and rejects ambiguous prefixes."""
+    sessions = [
+        SessionInfo(session_id="abc123", session_name="first"),
+        SessionInfo(session_id="abd456", session_name="abc"),
+        SessionInfo(session_id="xyz789", session_name="third"),
+    ]
+    with patch("src.apps.chat.Service.list_sessions", return_value=sessions):
+        assert _find_session("abd456") is sessions[1]
+        assert _find_session("third") is sessions[2]
+        # Names are matched before ID prefixes
+        assert _find_session("abc") is sessions[1]
+        assert _find_session("abc1") is sessions[0]
+        assert _find_session("xy") is sessions[2]
+        assert _find_session("ab") is None
+        assert _find_session("nope") is None
+
+
+def test_every_listed_command_has_a_handler():
+    """Test that /help and completion list exactly the commands that are handled."""
+    assert COMMAND_HANDLERS.keys() == COMMANDS.keys()
+
+    calls = []
+    with patch.dict(COMMAND_HANDLERS, {"/info": calls.append}):
+        handle_command("/INFO  some args ")
+    assert calls == ["some args"]
+
+
+def test_only_a_quick_second_ctrl_c_exits():
+    """Test that Ctrl+C stops processing, and exits when pressed twice within a second."""
+    times = [5_000_000_000, 6_500_000_000, 7_000_000_000]
+    with patch.object(chat, "interrupt_counter", 0), patch.object(
+        chat, "last_interrupt_ns", -chat.DOUBLE_INTERRUPT_NS
+    ), patch.object(chat, "message_queue") as message_queue, patch(
+        "time.monotonic_ns", side_effect=times
+    ), patch.object(chat, "console"):
+        handle_keyboard_interrupt()
+        handle_keyboard_interrupt()
+        with pytest.raises(TerminateChat):
+            handle_keyboard_interrupt()
+
+    assert message_queue.stop.call_count == 2
@@ -0,0 +1,89 @@
+import io
+import time
+from unittest.mock import patch
+
+from rich.console import Console
+
+from src.apps.display import StreamingResponse, print_message
+from src.neo.core.messages import CommandOutput, CommandResult, Message
+
+
+def test_chunks_received_between_renders_are_coalesced():
+    """Test that chunks arriving before the next render share one render."""
+    streaming = StreamingResponse()
+    with patch("rich.live.Live") as live_class, patch(
+        "rich.markdown.Markdown"
+    ) as markdown_class, patch("threading.Thread"):
+        streaming.feed("Hel")
+        streaming._render_pending()
+        for chunk in ["lo", " wor", "ld"]:
+            streaming.feed(chunk)
+        streaming._render_pending()
+        streaming._render_pending()
+
+    assert [c.args[0] for c in markdown_class.call_args_list] == ["Hel", "Hello world"]
+    assert live_class.return_value.update.call_count == 2
+
+
+def test_render_thread_shows_streamed_text_until_cleared():
+    """Test that fed text is rendered off the feeding thread, and clear stops it."""
+    streaming = StreamingResponse()
+    with patch("rich.live.Live") as live_class, patch(
+        "rich.markdown.Markdown"
+    ) as markdown_class:
+        streaming.feed("Hel")
+        streaming.feed("lo")
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if markdown_class.call_args_list and markdown_class.call_args.args[0] == "Hello":
+                break
+            time.sleep(0.01)
+        render_thread = streaming._render_thread
+        streaming.clear()
+
+    assert markdown_class.call_args.args[0] == "Hello"
+    assert not render_thread.is_alive()
+    live_class.return_value.stop.assert_called_once()
+
+
+def test_complete_blocks_are_parsed_once():
+    """Test that later renders only parse the block still being streamed."""
+    streaming = StreamingResponse()
+    chunks = ["Intro\n\n```\ncode\n\n", "more\n```\n\nTail", " end"]
+    with patch("rich.live.Live"), patch("rich.markdown.Markdown") as markdown_class, patch(
+        "threading.Thread"
+    ):
+        for chunk in chunks:
+            streaming.feed(chunk)
+            streaming._render_pending()
+
+    assert [c.args[0] for c in markdown_class.call_args_list] == [
+        # The blank line inside the open code fence does not end a block
+        "Intro\n\n```\ncode\n\n",
+        "Intro\n\n```\ncode\n\nmore\n```",
+        "Tail",
+        "Tail end",
+    ]
+
+
+def test_message_is_written_to_the_terminal_at_once():
+    """Test that the prints making up one message share a single write."""
+    file = io.StringIO()
+    message = Message(
+        role="assistant",
+        content=[
+            CommandResult(
+                content=f"result {i}",
+                success=True,
+                command_output=CommandOutput(name="read_file", message=f"Read {i}"),
+            )
+            for i in range(3)
+        ],
+    )
+    with patch("src.apps.display.console", Console(file=file, width=40)), patch.object(
+        file, "write", wraps=file.write
+    ) as write:
+        print_message(message)
+
+    assert write.call_count == 1
+    assert "Read 2" in file.getvalue()
@@ -0,0 +1,57 @@
+import os
+from unittest.mock import patch
+
+from prompt_toolkit.history import FileHistory
+
+from src.apps.history import BackgroundFileHistory, BoundedFileHistory
+
+
+def test_stored_entries_are_written_in_file_history_format(tmp_path):
+    """Test that committed entries load back through a plain FileHistory."""
+    history_file = str(tmp_path / "history")
+    history = BackgroundFileHistory(history_file)
+    history.store_string("first")
+    history.store_string("multi\nline")
+    history.commit()
+
+    assert list(FileHistory(history_file).load_history_strings()) == ["multi\nline", "first"]
+
+
+def test_history_file_is_opened_once_for_all_batches(tmp_path):
+    """Test that the writer keeps the file open instead of reopening it per batch."""
+    history_file = str(tmp_path / "history")
+    with patch("os.open", wraps=os.open) as os_open:
+        history = BackgroundFileHistory(history_file)
+        for entry in ["one", "two", "three"]:
+            history.store_string(entry)
+            history.commit()
+
+    assert [c.args[0] for c in os_open.call_args_list].count(history_file) == 1
+    assert list(FileHistory(history_file).load_history_strings()) == ["three", "two", "one"]
+
+
+def test_entries_that_cannot_be_encoded_do_not_stop_the_writer(tmp_path):
+    """Test that an entry with a lone surrogate is written and later ones still are."""
+    history_file = str(tmp_path / "history")
+    history = BackgroundFileHistory(history_file)
+    history.store_string("bad \ud800")
+    history.commit()
+    history.store_string("good")
+    history.commit()
+
+    assert list(FileHistory(history_file).load_history_strings()) == ["good", "bad ?"]
+
+
+def test_only_the_newest_entries_are_loaded(tmp_path):
+    """Test that loading reads back just the newest entries, across read chunks."""
+    history_file = str(tmp_path / "history")
+    entries = [f"entry {i}\n" + "x" * (i % 300) for i in range(500)]
+    writer = FileHistory(history_file)
+    for entry in entries:
+        writer.store_string(entry)
+
+    history = BoundedFileHistory(history_file, max_entries=50)
+    assert list(history.load_history_strings()) == entries[:-51:-1]
+
+    history = BoundedFileHistory(history_file, max_entries=1000)
+    assert list(history.load_history_strings()) == entries[::-1]
@@ -0,0 +1,12 @@
+from unittest.mock import patch
+
+from src.database.database import Database
+
+
+def test_schema_is_created_once_per_path(tmp_path):
+    """Test that later instances for the same database skip the schema setup."""
+    db_path = str(tmp_path / "state.db")
+    Database(db_path)
+    with patch("sqlite3.connect") as connect:
+        Database(db_path)
+    connect.assert_not_called()
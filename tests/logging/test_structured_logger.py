@@ -0,0 +1,58 @@
+import datetime
+import gc
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.logging.structured_logger import LogFile, StructuredLogger
+
+
+@pytest.fixture(autouse=True)
+def clear_log_files():
+    LogFile.load_from_path.cache_clear()
+    yield
+    LogFile.load_from_path.cache_clear()
+
+
+def test_entries_are_appended_across_reopens(tmp_path):
+    path = tmp_path / "logs" / "requests.json"
+    LogFile.load_from_path(path).add_document({"a": 1})
+
+    LogFile.load_from_path.cache_clear()
+    LogFile.load_from_path(path).add_document({"b": 2})
+
+    assert json.loads(path.read_text()) == [{"a": 1}, {"b": 2}]
+
+
+@pytest.mark.parametrize("contents", ["", "[\n]"])
+def test_existing_file_without_entries(tmp_path, contents):
+    """Empty files and files holding an empty array both get a valid first entry."""
+    path = tmp_path / "requests.json"
+    path.write_text(contents)
+
+    LogFile.load_from_path(path).add_document({"a": 1})
+
+    assert json.loads(path.read_text()) == [{"a": 1}]
+
+
+def test_file_is_closed_once_evicted(tmp_path):
+    """Log files dropped from the cache close their file when collected."""
+    log_file = LogFile.load_from_path(tmp_path / "requests.json")
+    file = log_file._file
+
+    LogFile.load_from_path.cache_clear()
+    del log_file
+    gc.collect()
+
+    assert file.closed
+
+
+def test_record_uses_the_given_timestamp(tmp_path):
+    """A timestamp read by the caller is recorded instead of reading the clock again."""
+    timestamp = datetime.datetime(2024, 1, 2, 3, 4, 5, 6)
+    with patch("src.logging.structured_logger.NEO_HOME", str(tmp_path)):
+        StructuredLogger().record("requests", {"session_id": "s", "a": 1}, timestamp=timestamp)
+
+    entries = json.loads((tmp_path / "s" / "requests.json").read_text())
+    assert entries == [{"session_id": "s", "a": 1, "timestamp": timestamp.isoformat()}]
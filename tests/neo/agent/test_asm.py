@@ -0,0 +1,56 @@
+from src.neo.agent.asm import AgentStateMachine
+from src.neo.agent.state import AgentState
+from src.neo.core.messages import Message
+
+
+def make_asm(**configuration):
+    return AgentStateMachine(
+        client=None, shell=None, session_id="test", configuration=configuration
+    )
+
+
+def checkpointed_state(text_size: int) -> AgentState:
+    return AgentState(
+        system="system",
+        messages=[
+            Message("user", "a" * text_size),
+            Message("developer", "checkpoint", metadata={"is_checkpoint": "true"}),
+            Message("assistant", "summary"),
+            Message("developer", "continue"),
+        ],
+    )
+
+
+def test_prune_state_triggers_on_token_budget():
+    """A few large messages are pruned at the latest checkpoint once over budget."""
+    asm = make_asm(**{"head_truncation.trigger_tokens": "100"})
+
+    pruned = asm.prune_state(checkpointed_state(1000))
+    assert [msg.model_text() for msg in pruned.messages] == ["checkpoint", "summary", "continue"]
+
+    state = checkpointed_state(10)
+    assert asm.prune_state(state) is state
+
+
+def test_prune_state_keeps_what_fits_the_retention_budget():
+    """Over the token budget, the oldest checkpoint whose tail fits the retention budget is kept."""
+    asm = make_asm(
+        **{
+            "head_truncation.trigger_tokens": "300",
+            "head_truncation.retention_tokens": "200",
+        }
+    )
+    state = checkpointed_state(1000).add_messages(
+        Message("user", "b" * 400),
+        Message("developer", "checkpoint 2", metadata={"is_checkpoint": "true"}),
+        Message("assistant", "summary 2"),
+    )
+
+    pruned = asm.prune_state(state)
+    assert [msg.model_text() for msg in pruned.messages] == [
+        "checkpoint", "summary", "continue", "b" * 400, "checkpoint 2", "summary 2"
+    ]
+
+    asm.head_truncation_retention_tokens = 50
+    pruned = asm.prune_state(state)
+    assert [msg.model_text() for msg in pruned.messages] == ["checkpoint 2", "summary 2"]
@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+from src.neo.agent.journal import StateJournal
+from src.neo.agent.state import AgentState
+from src.neo.core.messages import Message
+
+
+def texts(state):
+    return [msg.model_text() for msg in state.messages]
+
+
+def test_journal_replays_appends_and_drops(tmp_path):
+    """Appended and dropped messages are restored by replaying the journal."""
+    path = str(tmp_path / "agent_state.json")
+    journal = StateJournal(path)
+    state = journal.load(system="system")
+
+    state = state.add_messages(Message("user", "a"), Message("assistant", "b"))
+    journal.record(state)
+    state = state.add_messages(Message("user", "c")).drop(1)
+    journal.record(state)
+    journal.close()
+
+    loaded = StateJournal(path).load(system="system")
+    assert texts(loaded) == ["b", "c"]
+
+
+def test_journal_is_synced_on_close_only(tmp_path):
+    """Periodic flushes append without fsync; closing the journal syncs it."""
+    journal = StateJournal(str(tmp_path / "agent_state.json"))
+    state = journal.load(system="system")
+
+    with patch("src.neo.agent.journal.os.fsync") as fsync:
+        journal.record(state.add_messages(Message("user", "a")))
+        journal.flush()
+        fsync.assert_not_called()
+        journal.close()
+    fsync.assert_called_once()
+
+
+def test_journal_compacts_into_snapshot(tmp_path):
+    """Once the journal grows long the state is written as a snapshot."""
+    path = str(tmp_path / "agent_state.json")
+    journal = StateJournal(path)
+    state = journal.load(system="system")
+
+    for i in range(10):
+        state = state.add_messages(Message("user", str(i))).drop(1 if i else 0)
+        journal.record(state)
+    journal.close()
+
+    assert texts(StateJournal(path).load(system="system")) == ["9"]
+    with open(tmp_path / "agent_state.jsonl") as f:
+        assert len(f.readlines()) <= StateJournal.COMPACTION_RATIO
+
+
+def test_journal_loads_legacy_snapshot(tmp_path):
+    """State files written before the journal existed are still loaded."""
+    path = str(tmp_path / "agent_state.json")
+    AgentState(system="system", messages=[Message("user", "hello")]).dump(path)
+
+    assert texts(StateJournal(path).load(system="system")) == ["hello"]
@@ -0,0 +1,26 @@
+import pytest
+
+from src.neo.agent.marshal import marshal_rows, unmarshal_rows
+
+
+def test_marshal_rows_numbers_each_prompt():
+    """Test that every prompt becomes a numbered row of the message."""
+    message = marshal_rows(["Classify: apple", "Classify: carrot"], {"type": "string"})
+
+    assert "exactly one answer per request" in message
+    assert '{"type": "string"}' in message
+    assert message.endswith("1. Classify: apple\n2. Classify: carrot")
+
+
+def test_unmarshal_rows_accepts_fenced_arrays():
+    """Test that answers are parsed with or without a markdown code fence."""
+    assert unmarshal_rows('["fruit", "vegetable"]', 2) == ["fruit", "vegetable"]
+    assert unmarshal_rows('Here:\n```json\n[1, 2]\n```', 2) == [1, 2]
+
+
+def test_unmarshal_rows_rejects_wrong_answer_count():
+    """Test that a response without one answer per prompt is an error."""
+    with pytest.raises(ValueError):
+        unmarshal_rows('["fruit"]', 2)
+    with pytest.raises(ValueError):
+        unmarshal_rows('{"answer": "fruit"}', 1)
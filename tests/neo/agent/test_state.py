@@ -0,0 +1,41 @@
+from src.neo.agent.state import AgentState
+from src.neo.core.messages import Message
+
+
+def test_system_message_reused_across_updates():
+    """The system message is built once and shared by derived states."""
+    state = AgentState(system="You are a helpful assistant.")
+    first = state.to_messages()[0]
+
+    state = state.add_messages(Message("user", "hello"))
+    messages = state.to_messages()
+
+    assert messages[0] is first
+    assert messages[0].role == "system"
+    assert messages[0].model_text() == "You are a helpful assistant."
+    assert [msg.model_text() for msg in messages[1:]] == ["hello"]
+
+
+def test_dump_replaces_file_atomically(tmp_path):
+    """Dumping writes the whole state and leaves no temporary file behind."""
+    filepath = str(tmp_path / "agent_state.json")
+    state = AgentState(system="system").add_messages(Message("user", "hello"))
+    state.dump(filepath)
+    state.add_messages(Message("assistant", "hi")).dump(filepath)
+
+    loaded = AgentState.load(filepath, system="system")
+
+    assert [msg.model_text() for msg in loaded.messages] == ["hello", "hi"]
+    assert not (tmp_path / "agent_state.json.tmp").exists()
+
+
+def test_approx_tokens_tracked_across_updates():
+    """The running token estimate matches a full recount after adds and drops."""
+    state = AgentState(system="s" * 40)
+    state.approx_tokens()
+
+    state = state.add_messages(Message("user", "a" * 400), Message("assistant", "b" * 80))
+    state = state.drop(1).add_messages(Message("user", "c" * 8))
+
+    assert state.approx_tokens() == AgentState(system="s" * 40, messages=state.messages).approx_tokens()
+    assert state.approx_tokens() == (10 + 4) + (20 + 4) + (2 + 4)
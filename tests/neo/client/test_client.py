@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, patch, call
 import os
+import httpx
 import openai
 from datetime import datetime
 import json
@@ -9,7 +10,7 @@ from typing import Any, Dict, List, Optional, Callable
 
 from src.neo.client.client import Client
 from src.neo.core.messages import PrimitiveOutputType
-from src.neo.client.base import BaseClient
+from src.neo.client.open_router_proxy import OpenRouterProxy
 from src.neo.core.messages import (
     Message,
     TextBlock,
@@ -50,6 +51,21 @@ def create_mock_completion(
     return mock_completion
 
 
+def create_mock_stream(*texts: Optional[str]):
+    """Create mock stream chunks with the given text deltas, followed by usage."""
+    chunks = []
+    for text in texts:
+        chunk = MagicMock(id="mock-stream", usage=None)
+        chunk.choices = [MagicMock()]
+        chunk.choices[0].delta.content = text
+        chunks.append(chunk)
+
+    usage_chunk = MagicMock(id="mock-stream", choices=[])
+    usage_chunk.usage = MagicMock(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+    chunks.append(usage_chunk)
+    return iter(chunks)
+
+
 @pytest.fixture
 def mock_client_dependencies():
     """Set up all mock dependencies needed for testing the Client."""
@@ -57,15 +73,15 @@ def mock_client_dependencies():
     mock_shell = MagicMock(spec=Shell)
     mock_shell.describe.return_value = "Mock command description"
 
-    # Create environment variables required for BaseClient
+    # Create environment variables required for OpenRouterProxy
     os.environ["API_KEY"] = "test-api-key"
     os.environ["MODEL_ID"] = "test-model"
 
     # Patch methods
     with patch.object(
-        BaseClient, "_add_openrouter_metadata"
+        OpenRouterProxy, "_add_openrouter_metadata"
     ) as mock_add_metadata, patch(
-        "src.neo.client.base.StructuredLogger"
+        "src.neo.client.open_router_proxy.StructuredLogger"
     ) as mock_logger_class, patch(
         "openai.Client"
     ) as mock_openai_client_class:
@@ -417,5 +433,232 @@ def test_assistant_prefill_multi_turn_conversation(mock_client_dependencies):
     assert result.text() == "Actually, I think you're right."
 
 
+def test_preprocessed_messages_are_reused(mock_client_dependencies):
+    """Test that history messages are converted once and reused across requests."""
+    client = mock_client_dependencies["client"]
+
+    system_message = Message(role="system", content=[TextBlock("System instruction")])
+    developer_message = Message(role="developer", content=[TextBlock("Note")])
+    messages = [system_message, developer_message]
+
+    first = client._preprocess_messages(messages, [])
+    second = client._preprocess_messages(
+        messages + [Message(role="user", content=[TextBlock("Next")])], []
+    )
+
+    assert second[0] is first[0]
+    assert second[1] is first[1]
+    assert second[1].role == "user"
+    assert second[1].model_text() == "<SYSTEM>Note</SYSTEM>"
+    assert second[2].model_text() == "Next"
+
+
+def test_cache_anchors_stay_put(mock_client_dependencies):
+    """Test that cache-control markers only move once enough messages follow them."""
+    client = mock_client_dependencies["client"]
+    messages = [Message(role="system", content=[TextBlock("System instruction")])]
+
+    def marked():
+        return [i for i, msg in enumerate(messages) if msg.metadata.get("cache-control")]
+
+    messages.append(Message(role="user", content=[TextBlock("0")]))
+    client._mark_cache_anchors(messages)
+    assert marked() == [0, 1]
+
+    for i in range(Client.CACHE_ANCHOR_BUFFER):
+        messages.append(Message(role="user", content=[TextBlock(str(i + 1))]))
+        client._mark_cache_anchors(messages)
+        assert marked() == [0, 1]
+
+    messages.append(Message(role="user", content=[TextBlock("last")]))
+    client._mark_cache_anchors(messages)
+    assert marked() == [0, 1, len(messages) - 1]
+
+
+def test_identical_requests_reuse_cached_response(mock_client_dependencies):
+    """Test that the response cache skips the model for a repeated request."""
+    client = Client(mock_client_dependencies["shell"], response_cache_size=4)
+    create = mock_client_dependencies["openai_client"].chat.completions.create
+    messages = [
+        Message(role="system", content=[TextBlock("System instruction")]),
+        Message(role="user", content=[TextBlock("Hello")]),
+    ]
+
+    first = client._process(messages, commands=[])
+    second = client._process(messages, commands=[])
+
+    assert create.call_count == 1
+    assert second is not first
+    assert second.model_text() == first.model_text() == "Default response"
+
+    client._process([*messages, Message(role="user", content=[TextBlock("Again")])], [])
+    assert create.call_count == 2
+
+
+def test_streamed_response_is_passed_to_on_text(mock_client_dependencies):
+    """Test that streamed text reaches on_text and the full response is returned."""
+    client = mock_client_dependencies["client"]
+    create = mock_client_dependencies["openai_client"].chat.completions.create
+    create.return_value = create_mock_stream("Hello", None, " world")
+
+    streamed = []
+    result = client.process(
+        [
+            Message(role="system", content=[TextBlock("System instruction")]),
+            Message(role="user", content=[TextBlock("Hi")]),
+        ],
+        on_text=streamed.append,
+    )
+
+    assert streamed == ["Hello", " world"]
+    assert result.model_text() == "Hello world"
+    assert create.call_args[1]["stream"] is True
+
+
+def test_stream_interrupted_mid_response_is_reported(mock_client_dependencies):
+    """Test that a connection lost while streaming is returned as an error reply."""
+    client = mock_client_dependencies["client"]
+    create = mock_client_dependencies["openai_client"].chat.completions.create
+
+    def interrupted():
+        yield next(create_mock_stream("Hel"))
+        raise httpx.ReadTimeout("The read operation timed out")
+
+    stream = MagicMock()
+    stream.__iter__.return_value = interrupted()
+    create.return_value = stream
+
+    streamed = []
+    result = client.process(
+        [
+            Message(role="system", content=[TextBlock("System instruction")]),
+            Message(role="user", content=[TextBlock("Hi")]),
+        ],
+        on_text=streamed.append,
+    )
+
+    assert streamed == ["Hel"]
+    assert result.model_text().startswith("I'm sorry, I encountered an error")
+    stream.close.assert_called_once_with()
+
+
+def test_rejected_response_text_is_discarded_before_retry(mock_client_dependencies):
+    """Test that on_retry lets streamed text of a rejected response be discarded."""
+    client = mock_client_dependencies["client"]
+    mock_shell = mock_client_dependencies["shell"]
+    create = mock_client_dependencies["openai_client"].chat.completions.create
+
+    invalid_call = f"{COMMAND_START}invalid_command{COMMAND_END}"
+    valid_call = f"{COMMAND_START}valid_command{COMMAND_END}"
+    streams = [create_mock_stream("Try ", invalid_call), create_mock_stream("Retry ", valid_call)]
+    configure_completion_factory(
+        mock_client_dependencies["openai_client"], lambda **kwargs: streams.pop(0)
+    )
+    mock_shell.validate_command_calls.side_effect = lambda calls, schema=None: [
+        CommandResult(content="Invalid command: not found", success=False)
+        for call in calls
+        if "invalid_command" in call.content
+    ]
+    mock_shell.parse_command_call.side_effect = lambda call, schema=None: call
+
+    preview = []
+    result = client.process(
+        [
+            Message(role="system", content=[TextBlock("System instruction")]),
+            Message(role="user", content=[TextBlock("Hi")]),
+        ],
+        on_text=preview.append,
+        on_retry=preview.clear,
+    )
+
+    assert create.call_count == 2
+    assert "".join(preview) == f"Retry {valid_call}"
+    assert "valid_command" in result.get_command_calls()[0].model_text()
+
+
+def test_batch_process_returns_responses_in_order(mock_client_dependencies):
+    """Test that batched conversations are all sent and answered in order."""
+    client = mock_client_dependencies["client"]
+    create = mock_client_dependencies["openai_client"].chat.completions.create
+    configure_completion_factory(
+        mock_client_dependencies["openai_client"],
+        lambda **kwargs: create_mock_completion(
+            "Re: " + kwargs["messages"][-1]["content"][0]["text"]
+        ),
+    )
+    system_message = Message(role="system", content=[TextBlock("System instruction")])
+
+    results = client.batch_process(
+        [
+            [system_message, Message(role="user", content=[TextBlock(str(i))])]
+            for i in range(10)
+        ]
+    )
+
+    assert create.call_count == 10
+    assert [result.model_text() for result in results] == [f"Re: {i}" for i in range(10)]
+
+
+def test_message_token_counts_are_reused(mock_client_dependencies):
+    """Test that resent message texts are not tokenized again."""
+    proxy = mock_client_dependencies["client"]._client
+    encoding = MagicMock()
+    encoding.encode.side_effect = str.split
+    messages = [
+        Message(role="system", content=[TextBlock("System instruction")]),
+        Message(role="user", content=[TextBlock("Hello")]),
+    ]
+
+    with patch("src.neo.client.open_router_proxy._get_encoding", return_value=encoding):
+        first = proxy.count_tokens(proxy._build_request(messages, "test-model"))
+        encoded = [c.args[0] for c in encoding.encode.call_args_list]
+        assert encoded == ["system", "System instruction", "user", "Hello"]
+
+        messages.append(Message(role="user", content=[TextBlock("Again")]))
+        encoding.encode.reset_mock()
+        second = proxy.count_tokens(proxy._build_request(messages, "test-model"))
+        encoded = [c.args[0] for c in encoding.encode.call_args_list]
+        assert encoded == ["system", "user", "user", "Again"]
+
+    assert second == first + 1 + 1 + 4 + 5
+
+
+def test_message_payloads_are_reused(mock_client_dependencies):
+    """Test that resent messages reuse their payloads, with the current cache marker."""
+    proxy = mock_client_dependencies["client"]._client
+    messages = [
+        Message(role="system", content=[TextBlock("System instruction")]),
+        Message(role="user", content=[TextBlock("Hello")]),
+    ]
+    messages[1].metadata["cache-control"] = True
+
+    first = proxy._build_request(messages, "test-model")["messages"]
+    assert "cache_control" in first[1]["content"][0]
+
+    messages[1].metadata["cache-control"] = False
+    second = proxy._build_request(messages, "test-model")["messages"]
+    assert second[0] is first[0]
+    assert second[1] is not first[1]
+    assert "cache_control" not in second[1]["content"][0]
+    assert second[1]["content"][0]["text"] is first[1]["content"][0]["text"]
+
+
+def test_warmup_loads_the_tokenizer_and_connects_once(mock_client_dependencies):
+    """Test that warmup prepares the proxy on a background thread, only once."""
+    client = mock_client_dependencies["client"]
+    openai_client = mock_client_dependencies["openai_client"]
+
+    with patch("src.neo.client.open_router_proxy._get_encoding") as get_encoding, patch(
+        "threading.Thread"
+    ) as thread_class:
+        client.warmup()
+        client.warmup()
+        assert thread_class.call_count == 1
+        thread_class.call_args.kwargs["target"]()
+
+    get_encoding.assert_called_once_with()
+    openai_client.models.list.assert_called_once_with()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,54 @@
+"""Tests for the recall_archive command."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.neo.agent.journal import StateJournal
+from src.neo.commands.recall_archive import RecallArchiveCommand
+from src.neo.core.messages import Message
+
+
+def test_recall_archive_finds_pruned_messages(tmp_path):
+    """Messages dropped from the state are archived and can be searched."""
+    session = SimpleNamespace(internal_session_dir=str(tmp_path))
+    command = RecallArchiveCommand()
+
+    journal = StateJournal(str(tmp_path / "agent_state.json"))
+    state = journal.load(system="system")
+    state = state.add_messages(
+        Message("user", "The schema lives in db/schema.sql"),
+        Message("assistant", "Noted"),
+        Message("user", "Now add a column"),
+    )
+    journal.record(state)
+    journal.record(state.drop(2))
+    journal.close()
+
+    result = command.execute(session, '"SCHEMA" --limit 3')
+    assert result.success
+    assert result.content == "[user] The schema lives in db/schema.sql"
+
+    result = command.execute(session, "column")
+    assert result.content == "No archived messages match the pattern."
+
+    with pytest.raises(ValueError):
+        command.execute(session, "(")
+
+
+def test_recall_archive_skips_malformed_lines(tmp_path):
+    """Malformed archive lines are skipped instead of failing the search."""
+    session = SimpleNamespace(internal_session_dir=str(tmp_path))
+
+    journal = StateJournal(str(tmp_path / "agent_state.json"))
+    state = journal.load(system="system")
+    state = state.add_messages(Message("user", "The schema lives in db/schema.sql"))
+    journal.record(state)
+    journal.record(state.drop(1))
+    journal.close()
+    with open(journal.archive_path, "ab") as f:
+        f.write(b'{"role": "user", "content"')
+
+    result = RecallArchiveCommand().execute(session, "schema")
+    assert result.success
+    assert result.content == "[user] The schema lives in db/schema.sql"
@@ -0,0 +1,29 @@
+from src.neo.core.messages import Message, TextBlock
+from src.utils import serialization
+
+
+def test_to_dict_reuses_serialized_content():
+    """Content blocks are serialized once while the content is unchanged."""
+    message = Message("user", "hello")
+    first = message.to_dict()
+
+    assert message.to_dict()["content"] is first["content"]
+    assert first == {
+        "role": "user",
+        "content": [{"type": "TextBlock", "value": "hello"}],
+        "metadata": {},
+    }
+
+    message.add_content(TextBlock("world"))
+    assert [block["value"] for block in message.to_dict()["content"]] == ["hello", "world"]
+
+
+def test_from_dict_round_trip():
+    message = Message.from_text("assistant", "hi", metadata={"is_checkpoint": "true"})
+    assert Message.from_dict(message.to_dict()).to_dict() == message.to_dict()
+
+
+def test_from_dict_shares_role_strings():
+    data = serialization.loads(serialization.dumps(Message.from_text("assistant", "hi").to_dict()))
+    other = serialization.loads(serialization.dumps(Message.from_text("assistant", "hey").to_dict()))
+    assert Message.from_dict(data).role is Message.from_dict(other).role
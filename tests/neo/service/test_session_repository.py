@@ -0,0 +1,35 @@
+import sqlite3
+
+from src.neo.service.database.session_repository import SessionRepository
+
+
+def _repository(db_path):
+    connection = sqlite3.connect(db_path)
+    connection.row_factory = sqlite3.Row
+    connection.execute("CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT)")
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS sessions (session_id TEXT PRIMARY KEY, "
+        "session_name TEXT UNIQUE, is_temporary INTEGER, workspace TEXT, "
+        "created_at TEXT, updated_at TEXT)"
+    )
+    connection.commit()
+    repository = SessionRepository.__new__(SessionRepository)
+    repository._db = connection
+    return repository
+
+
+def test_session_list_is_reread_after_changes(tmp_path):
+    """Test that the cached session list follows changes from any connection."""
+    db_path = str(tmp_path / "neo.db")
+    repository = _repository(db_path)
+    assert repository.list_sessions() == []
+
+    repository.create_session("a", "first")
+    assert [s["session_name"] for s in repository.list_sessions()] == ["first"]
+
+    _repository(db_path).create_session("b", "second", is_temporary=True)
+    assert [s["session_name"] for s in repository.list_sessions()] == ["first"]
+    assert len(repository.list_sessions(include_temporary=True)) == 2
+
+    repository.delete_session("a")
+    assert repository.list_sessions() == []
@@ -0,0 +1,30 @@
+import unittest
+
+from src.utils.cache import IdentityLRUCache
+
+
+class TestIdentityLRUCache(unittest.TestCase):
+    """Unit tests for IdentityLRUCache."""
+
+    def test_lookup_by_identity(self):
+        """Test that equal but distinct objects do not share entries."""
+        cache = IdentityLRUCache(maxsize=4)
+        key = ["a"]
+        cache.put(key, 1)
+
+        self.assertEqual(cache.get(key), 1)
+        self.assertIsNone(cache.get(["a"]))
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = IdentityLRUCache(maxsize=2)
+        first, second, third = object(), object(), object()
+        cache.put(first, 1)
+        cache.put(second, 2)
+        cache.get(first)
+        cache.put(third, 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(first), 1)
+        self.assertIsNone(cache.get(second))
+        self.assertEqual(cache.get(third), 3)
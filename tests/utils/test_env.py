@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from textwrap import dedent
+from unittest import mock
+
+from src.utils.env import find_env_file, load_env, parse_env
+
+
+class TestEnv(unittest.TestCase):
+    """Unit tests for the .env loader in env.py."""
+
+    def test_parse_env(self):
+        """Test comments, export prefixes, quoting and inline comments."""
+        text = dedent(
+            """
+            # comment
+            export A=1
+            B = "x\\ny"
+            C='lit\\n'
+            D=plain # trailing comment
+            not a variable
+            """
+        )
+        self.assertEqual(
+            parse_env(text),
+            {"A": "1", "B": "x\ny", "C": "lit\\n", "D": "plain"},
+        )
+
+    def test_load_env_does_not_override(self):
+        """Test that existing environment variables take precedence."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            nested_dir = os.path.join(temp_dir, "a", "b")
+            os.makedirs(nested_dir)
+            env_path = os.path.join(temp_dir, ".env")
+            with open(env_path, "w", encoding="utf-8") as f:
+                f.write("NEO_TEST_EXISTING=new\nNEO_TEST_MISSING=value\n")
+
+            self.assertEqual(find_env_file(nested_dir), env_path)
+
+            with mock.patch.dict(os.environ, {"NEO_TEST_EXISTING": "old"}):
+                self.assertTrue(load_env(env_path))
+                self.assertEqual(os.environ["NEO_TEST_EXISTING"], "old")
+                self.assertEqual(os.environ["NEO_TEST_MISSING"], "value")
+
+        self.assertFalse(load_env(os.path.join(temp_dir, ".env")))
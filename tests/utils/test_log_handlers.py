@@ -0,0 +1,69 @@
+import logging
+import os
+import tempfile
+import unittest
+
+from src.utils.log_handlers import BufferedRotatingFileHandler, CachedTimeFormatter
+
+
+class TestBufferedRotatingFileHandler(unittest.TestCase):
+    """Unit tests for BufferedRotatingFileHandler."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.temp_dir.name, "test.log")
+        self.logger = logging.getLogger(f"test_handlers.{id(self)}")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+
+    def tearDown(self):
+        for handler in self.logger.handlers[:]:
+            self.logger.removeHandler(handler)
+            handler.close()
+        self.temp_dir.cleanup()
+
+    def _read(self, path=None):
+        with open(path or self.log_file, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def test_flushes_on_flush_level(self):
+        """Test that records are buffered until a WARNING is logged."""
+        handler = BufferedRotatingFileHandler(self.log_file, flush_interval=0)
+        self.logger.addHandler(handler)
+
+        self.logger.info("buffered")
+        self.assertEqual(self._read(), "")
+
+        self.logger.warning("flushed")
+        self.assertEqual(self._read(), "buffered\nflushed\n")
+
+    def test_rollover(self):
+        """Test that the file rotates once maxBytes would be exceeded."""
+        handler = BufferedRotatingFileHandler(
+            self.log_file, maxBytes=20, backupCount=1, flush_interval=0
+        )
+        self.logger.addHandler(handler)
+
+        self.logger.info("0123456789")
+        self.logger.info("abcdefghij")
+        handler.flush()
+
+        self.assertEqual(self._read(self.log_file + ".1"), "0123456789\n")
+        self.assertEqual(self._read(), "abcdefghij\n")
+
+
+class TestCachedTimeFormatter(unittest.TestCase):
+    """Unit tests for CachedTimeFormatter."""
+
+    def test_matches_default_formatter(self):
+        """Test that cached timestamps match logging.Formatter output."""
+        fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        datefmt = "%Y-%m-%d %H:%M:%S"
+        cached = CachedTimeFormatter(fmt, datefmt=datefmt)
+        default = logging.Formatter(fmt, datefmt=datefmt)
+
+        for created in (1000.1, 1000.9, 1001.0, 999.5):
+            record = logging.makeLogRecord(
+                {"name": "test", "levelname": "INFO", "msg": "hello", "created": created}
+            )
+            self.assertEqual(cached.format(record), default.format(record))
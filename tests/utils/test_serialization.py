@@ -0,0 +1,28 @@
+import unittest
+from unittest import mock
+
+from src.utils import serialization
+
+
+class TestSerialization(unittest.TestCase):
+    """Unit tests for the JSON serialization helpers."""
+
+    data = {"role": "user", "content": [{"type": "TextBlock", "value": "héllo ▶"}]}
+
+    def test_round_trip(self):
+        """Test that data survives a round trip as compact JSON bytes."""
+        encoded = serialization.dumps(self.data)
+        self.assertIsInstance(encoded, bytes)
+        self.assertNotIn(b'": ', encoded)
+        self.assertEqual(serialization.loads(encoded), self.data)
+
+    def test_standard_library_fallback(self):
+        """Test that the json module is used when orjson is unavailable."""
+        with mock.patch.object(serialization, "orjson", None):
+            encoded = serialization.dumps(self.data)
+            self.assertEqual(serialization.loads(encoded), self.data)
+            self.assertEqual(serialization.loads(encoded.decode("utf-8")), self.data)
+
+
+if __name__ == "__main__":
+    unittest.main()